@@ -6,6 +6,7 @@ class ConversionJobAdmin(admin.ModelAdmin):
     list_display = ('original_filename', 'user', 'compression_mode', 'document_type', 
                    'status', 'created_at', 'completed_at')
     list_filter = ('status', 'compression_mode', 'document_type', 'bnf_compliant')
+    list_select_related = ('user',)
     search_fields = ('original_filename', 'user__username')
     readonly_fields = ('id', 'created_at', 'updated_at', 'completed_at', 'task_id')
     fieldsets = (
@@ -197,6 +197,21 @@ class BnFValidator:
         
         return enforced_config
 
+def parse_compression_ratio(value: Any, default: float = 0.0) -> float:
+    """
+    Parse a compression ratio given as a number or as an "X.YY:1" string.
+    
+    Args:
+        value: Ratio value reported by jp2forge
+        default (float): Value returned when no ratio is present
+        
+    Returns:
+        float: The ratio as a number (e.g. 4.5 for "4.50:1")
+    """
+    if not value:
+        return default
+    return float(str(value).partition(':')[0] or default)
+
 def get_validator(tolerance: Optional[float] = None) -> BnFValidator:
     """
     Get a BnF validator instance with optional custom tolerance.
@@ -9,13 +9,19 @@ import django
 import platform
 import sys
 import importlib.metadata
+from functools import lru_cache
 from django.conf import settings
 
 
+@lru_cache(maxsize=None)
 def get_version_info():
     """
     Collect version information for key dependencies.
     
+    Installed versions cannot change while the process runs, so the
+    package metadata is read once and the result cached for every
+    later request.
+    
     Returns:
         dict: Dictionary containing version information for various components.
     """
@@ -0,0 +1,21 @@
+"""
+URL path converters for the converter application.
+"""
+
+import uuid
+
+
+class JobIdConverter:
+    """Path converter for ConversionJob UUIDs.
+    
+    The pattern only admits canonical lowercase UUIDs, so the value is known
+    to be valid hex and can be decoded directly without the string
+    normalisation and validation done by Django's built-in ``uuid`` converter.
+    """
+    regex = '[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}'
+    
+    def to_python(self, value):
+        return uuid.UUID(bytes=bytes.fromhex(value.replace('-', '')))
+    
+    def to_url(self, value):
+        return str(value)
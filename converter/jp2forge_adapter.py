@@ -20,7 +20,7 @@ from typing import Dict, Any, Optional, Callable, Union, List
 from django.conf import settings
 
 # Import BnF validator
-from .bnf_validator import get_validator, BnFStandards
+from .bnf_validator import get_validator, parse_compression_ratio, BnFStandards
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -354,16 +354,16 @@ class JP2ForgeAdapter:
         import os
         import shutil
         
-        if not os.path.exists(input_path):
+        # Get input file size (a single stat also confirms the file exists)
+        try:
+            input_size = os.stat(input_path).st_size
+        except FileNotFoundError:
             logger.error(f"Input file not found: {input_path}")
             return JP2ForgeResult(None, success=False, error=f"Input file not found: {input_path}")
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        # Get input file size
-        input_size = os.path.getsize(input_path)
-        
         # Simulate conversion progress
         total_steps = 10
         for i in range(total_steps + 1):
@@ -375,9 +375,10 @@ class JP2ForgeAdapter:
         base_name = os.path.splitext(os.path.basename(input_path))[0]
         output_file = os.path.join(output_dir, f"{base_name}.jp2")
         
-        # Try to copy the file as a mock "conversion"
+        # Try to copy the file as a mock "conversion"; copyfile lets the kernel
+        # move the bytes (sendfile) so large inputs are never buffered in Python
         try:
-            shutil.copy(input_path, output_file)
+            shutil.copyfile(input_path, output_file)
         except Exception as e:
             # If copy fails (e.g., incompatible format), create an empty file
             with open(output_file, 'wb') as f:
@@ -448,11 +449,7 @@ class JP2ForgeAdapter:
         if result.file_sizes:
             if 'compression_ratio' in result.file_sizes:
                 # Parse ratio if it's a string in format "X.YY:1"
-                ratio_value = result.file_sizes['compression_ratio']
-                if isinstance(ratio_value, str) and ':' in ratio_value:
-                    compression_ratio = float(ratio_value.split(':')[0])
-                else:
-                    compression_ratio = float(ratio_value) if ratio_value else 1.0
+                compression_ratio = parse_compression_ratio(result.file_sizes['compression_ratio'], default=1.0)
             elif 'original_size' in result.file_sizes and 'converted_size' in result.file_sizes:
                 # Calculate it from file sizes
                 original_size = result.file_sizes['original_size']
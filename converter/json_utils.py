@@ -0,0 +1,120 @@
+"""
+JSON Utilities Module
+
+This module provides orjson-backed JSON encoding, decoding and HTTP responses
+for the converter application. orjson is used when installed; otherwise the standard library
+implementation is used transparently.
+"""
+
+import json
+import logging
+import math
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+# Try to import orjson, falling back to the standard library if unavailable
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+    logger.info("orjson is not installed, using the standard library json module")
+
+def _has_non_finite_float(data):
+    """
+    Check whether a JSON-like structure contains NaN or infinite floats.
+    
+    Args:
+        data: Data structure (dict, list, etc.) to inspect
+        
+    Returns:
+        bool: True if any float in the structure is not finite
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+class OrjsonEncoder(DjangoJSONEncoder):
+    """
+    JSON encoder that serializes with orjson when available.
+    
+    Types orjson does not handle natively (Decimal, timedelta, lazy strings)
+    are passed through DjangoJSONEncoder.default. If orjson rejects the value
+    entirely, the standard library encoder is used instead. orjson writes
+    NaN and Infinity as null, so values containing them are also encoded
+    with the standard library, which keeps them as NaN/Infinity.
+    """
+    
+    def encode(self, o):
+        if ORJSON_AVAILABLE:
+            try:
+                encoded = orjson.dumps(o, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                pass
+            else:
+                # A non-finite float can only have produced a null; skip the walk otherwise
+                if 'null' not in encoded or not _has_non_finite_float(o):
+                    return encoded
+        return super().encode(o)
+
+class OrjsonDecoder(json.JSONDecoder):
+    """
+    JSON decoder that parses with orjson when available.
+    
+    orjson rejects the NaN/Infinity literals OrjsonEncoder can write, so
+    documents it cannot parse are decoded with the standard library.
+    """
+    
+    def decode(self, s, *args, **kwargs):
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(s)
+            except orjson.JSONDecodeError:
+                pass
+        return super().decode(s, *args, **kwargs)
+
+def dumps_json(data, indent=False, default=str):
+    """
+    Serialize data to UTF-8 encoded JSON bytes.
+    
+    Uses orjson (including numpy scalar support) when available and the
+    standard library otherwise. Values of unknown types are converted with
+    ``default``; pass ``default=None`` to raise TypeError for them instead.
+    
+    Args:
+        data: Data structure to serialize
+        indent (bool): Pretty-print with two-space indentation
+        default (callable, optional): Conversion for non-JSON types
+        
+    Returns:
+        bytes: The encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=default, option=option)
+    return json.dumps(data, default=default, indent=2 if indent else None).encode('utf-8')
+
+class OrjsonResponse(HttpResponse):
+    """
+    JSON HTTP response serialized with dumps_json (orjson when available).
+    
+    A drop-in replacement for JsonResponse for dict payloads; values orjson
+    does not handle natively are converted with DjangoJSONEncoder.default.
+    """
+    
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(dumps_json(data, default=DjangoJSONEncoder().default), **kwargs)
@@ -80,28 +80,44 @@ class Command(BaseCommand):
             self._reset_redis_queues()
             
         # Step 4: Process stuck jobs
-        recovered = 0
+        stuck_jobs = list(stuck_jobs.only('id', 'original_filename', 'created_at'))
         for job in stuck_jobs:
             self.stdout.write(f'Job {job.id}: {job.original_filename} - Created: {job.created_at}')
-            
-            if not dry_run:
-                # Update job to retry
-                job.status = 'retry'
-                job.progress = 0
-                job.error_message = 'Recovered from stuck pending state by admin command'
-                job.save()
-                
-                # Requeue the job in Celery
-                try:
-                    from converter.tasks import process_conversion_job
-                    result = process_conversion_job.delay(str(job.id))
-                    self.stdout.write(f'  ↳ Re-queued as task {result.id}')
-                    recovered += 1
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(f'  ↳ Failed to re-queue: {str(e)}'))
-            else:
+            if dry_run:
                 self.stdout.write('  ↳ Would recover this job (dry run)')
         
+        recovered = 0
+        if not dry_run:
+            # Update all jobs to retry with a single UPDATE
+            recovered_jobs = ConversionJob.objects.filter(id__in=[job.id for job in stuck_jobs])
+            recovered_jobs.update(
+                status='retry',
+                progress=0,
+                error_message='Recovered from stuck pending state by admin command',
+                # update() bypasses auto_now, so set the timestamp explicitly
+                updated_at=timezone.now()
+            )
+            
+            # Requeue the jobs in Celery as one group instead of one publish per job
+            try:
+                from celery import group
+                from converter.tasks import process_conversion_job
+                group_result = group(
+                    process_conversion_job.s(str(job.id)) for job in stuck_jobs
+                ).apply_async()
+                for job, result in zip(stuck_jobs, group_result.results):
+                    self.stdout.write(f'  ↳ Job {job.id} re-queued as task {result.id}')
+                recovered = len(stuck_jobs)
+            except Exception as e:
+                # Nothing was queued; mark the jobs failed so they can be reprocessed
+                # instead of being left in the retry state
+                recovered_jobs.update(
+                    status='failed',
+                    error_message=f'Failed to re-queue recovered job: {str(e)}',
+                    updated_at=timezone.now()
+                )
+                self.stdout.write(self.style.ERROR(f'  ↳ Failed to re-queue, marked {len(stuck_jobs)} jobs as failed: {str(e)}'))
+        
         if not dry_run:
             self.stdout.write(self.style.SUCCESS(f'Successfully recovered {recovered} of {job_count} stuck jobs'))
         else:
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("converter", "0002_conversionjob_enable_expert_mode"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="conversionjob",
+            index=models.Index(
+                fields=["user", "status", "-created_at"],
+                name="conv_job_user_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="conversionjob",
+            index=models.Index(
+                fields=["status", "-created_at"], name="conv_job_status_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:07
+
+import converter.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("converter", "0003_conversionjob_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="conversionjob",
+            name="id",
+            field=models.UUIDField(
+                default=converter.models.time_ordered_uuid,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
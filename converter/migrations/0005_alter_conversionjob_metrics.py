@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:07
+
+import converter.json_utils
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("converter", "0004_alter_conversionjob_id"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="conversionjob",
+            name="metrics",
+            field=models.JSONField(
+                blank=True,
+                decoder=converter.json_utils.OrjsonDecoder,
+                default=dict,
+                encoder=converter.json_utils.OrjsonEncoder,
+            ),
+        ),
+    ]
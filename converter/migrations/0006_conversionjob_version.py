@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("converter", "0005_alter_conversionjob_metrics"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="conversionjob",
+            name="version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("converter", "0006_conversionjob_version"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="conversionjob",
+            index=models.Index(
+                fields=["user", "-created_at"], name="conv_job_user_created_idx"
+            ),
+        ),
+    ]
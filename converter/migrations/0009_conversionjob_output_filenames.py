@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("converter", "0008_conversionjob_output_count"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="conversionjob",
+            name="output_filenames",
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
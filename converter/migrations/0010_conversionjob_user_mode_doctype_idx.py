@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("converter", "0009_conversionjob_output_filenames"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="conversionjob",
+            index=models.Index(
+                fields=["user", "compression_mode", "-created_at"],
+                name="conv_job_user_mode_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="conversionjob",
+            index=models.Index(
+                fields=["user", "document_type", "-created_at"],
+                name="conv_job_user_doctype_idx",
+            ),
+        ),
+    ]
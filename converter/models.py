@@ -7,8 +7,12 @@ including job metadata, file handling, and BnF compliance tracking.
 from django.db import models
 from django.contrib.auth.models import User
 from django.urls import reverse
+from django.utils.functional import cached_property
 import uuid
 import os
+import time
+
+from .json_utils import OrjsonEncoder, OrjsonDecoder
 
 def job_directory_path(instance, filename):
     """Generate unique file upload path for conversion job files.
@@ -25,6 +29,42 @@ def job_directory_path(instance, filename):
     """
     return f'jobs/{instance.id}/{filename}'
 
+def time_ordered_uuid():
+    """Generate a time-ordered (UUIDv7 layout) identifier for new jobs.
+    
+    The leading 48 bits hold the Unix timestamp in milliseconds, so new
+    primary keys are inserted near the end of the index instead of at
+    random positions, while remaining valid UUIDs for existing URLs.
+    
+    Returns:
+        uuid.UUID: Version 7 UUID
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                          # version 7
+    value |= (rand >> 68) << 64                 # 12 random bits
+    value |= 0b10 << 62                         # RFC 4122 variant
+    value |= rand & ((1 << 62) - 1)             # 62 random bits
+    return uuid.UUID(int=value)
+
+class ConversionJobQuerySet(models.QuerySet):
+    """QuerySet helpers shared by views, admin and tasks."""
+    
+    def with_user(self):
+        """Join the owning user in the same query to avoid per-row lookups."""
+        return self.select_related('user')
+    
+    # Columns rendered by the dashboard and job list templates
+    LIST_FIELDS = (
+        'id', 'status', 'progress', 'original_filename', 'result_file',
+        'compression_mode', 'document_type', 'created_at', 'output_count',
+    )
+    
+    def for_list(self):
+        """Load only the columns list views render (no metrics or error_message)."""
+        return self.only(*self.LIST_FIELDS)
+
 class ConversionJob(models.Model):
     """Model representing a JPEG2000 conversion job.
     
@@ -53,6 +93,7 @@ class ConversionJob(models.Model):
         task_id (str): Celery task identifier
         original_size (int): Size of input file in bytes
         converted_size (int): Size of output file in bytes
+        output_count (int): Number of JP2 files produced (0 until completed)
         compression_ratio (float): Ratio of compression achieved
         created_at (datetime): Job creation timestamp
         updated_at (datetime): Last modification timestamp
@@ -60,6 +101,7 @@ class ConversionJob(models.Model):
         metrics (dict): Quality metrics and conversion statistics
         error_message (str): Error details if job failed
         enable_expert_mode (bool): Whether advanced options are enabled
+        version (int): Processing run counter used for optimistic locking
     """
     # Compression mode choices with detailed descriptions
     COMPRESSION_CHOICES = [
@@ -85,7 +127,7 @@ class ConversionJob(models.Model):
         ('failed', 'Failed'),         # Conversion failed with error
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=time_ordered_uuid, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='conversion_jobs')
     original_file = models.FileField(upload_to=job_directory_path)
     original_filename = models.CharField(max_length=255)
@@ -103,15 +145,35 @@ class ConversionJob(models.Model):
     
     original_size = models.BigIntegerField(blank=True, null=True)
     converted_size = models.BigIntegerField(blank=True, null=True)
+    output_count = models.PositiveIntegerField(default=0)
+    # Basenames of the JP2 files in the job's output directory, recorded on completion
+    output_filenames = models.JSONField(default=list, blank=True)
     compression_ratio = models.FloatField(blank=True, null=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     completed_at = models.DateTimeField(blank=True, null=True)
     
-    metrics = models.JSONField(default=dict, blank=True)
+    metrics = models.JSONField(default=dict, blank=True, encoder=OrjsonEncoder, decoder=OrjsonDecoder)
     error_message = models.TextField(blank=True, null=True)
     enable_expert_mode = models.BooleanField(default=False)
+    # Bumped each time a worker claims the job; task writes are conditional on it
+    version = models.PositiveIntegerField(default=0, editable=False)
+    
+    objects = ConversionJobQuerySet.as_manager()
+    
+    class Meta:
+        indexes = [
+            # Per-user dashboard/job list queries filtered by status, newest first
+            models.Index(fields=['user', 'status', '-created_at'], name='conv_job_user_status_idx'),
+            # Unfiltered per-user job list and recent jobs, newest first
+            models.Index(fields=['user', '-created_at'], name='conv_job_user_created_idx'),
+            # Per-user job list filtered by compression mode or document type
+            models.Index(fields=['user', 'compression_mode', '-created_at'], name='conv_job_user_mode_idx'),
+            models.Index(fields=['user', 'document_type', '-created_at'], name='conv_job_user_doctype_idx'),
+            # Status scans across all users (stuck job recovery, monitoring)
+            models.Index(fields=['status', '-created_at'], name='conv_job_status_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.original_filename} - {self.status}"
@@ -119,24 +181,62 @@ class ConversionJob(models.Model):
     def get_absolute_url(self):
         return reverse('job_detail', args=[str(self.id)])
     
-    @property
+    @cached_property
     def has_multiple_outputs(self):
-        """Check if this job has multiple output JP2 files (like from a multi-page TIFF)"""
+        """Check if this job has multiple output JP2 files (like from a multi-page TIFF).
+        
+        Uses the output count recorded when the job completed; only jobs
+        completed before it was recorded fall back to scanning the output
+        directory. The result is cached on the instance, so repeated
+        template lookups only scan once per request.
+        """
+        if self.output_count:
+            return self.output_count > 1
+        
         from django.conf import settings
-        import os
         
         # Path to the job's output directory
         output_dir = os.path.join(settings.MEDIA_ROOT, f'jobs/{self.id}/output')
         
-        # If output directory doesn't exist, return False
-        if not os.path.exists(output_dir):
+        # Stop scanning as soon as a second JP2 file is seen
+        jp2_count = 0
+        try:
+            with os.scandir(output_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.jp2'):
+                        jp2_count += 1
+                        if jp2_count > 1:
+                            return True
+        except FileNotFoundError:
+            # Output directory doesn't exist yet
             return False
         
-        # Count JP2 files in the directory
-        jp2_files = [f for f in os.listdir(output_dir) if f.endswith('.jp2')]
+        return False
+    
+    @cached_property
+    def output_jp2_paths(self):
+        """List the paths of this job's JP2 output files.
+        
+        Uses the output filenames recorded when the job completed, so no
+        filesystem access is needed; callers that open the files must check
+        that they still exist. Jobs completed before they were
+        recorded fall back to scanning the output directory once with
+        os.scandir; a missing directory yields an empty list. Symlinks are
+        not followed, so the file type comes straight from the directory
+        entry without a stat call. The result is cached on the instance.
+        """
+        from django.conf import settings
+        
+        output_dir = os.path.join(settings.MEDIA_ROOT, f'jobs/{self.id}/output')
+        if self.output_filenames:
+            return [os.path.join(output_dir, filename) for filename in self.output_filenames]
         
-        # If there are more than one JP2 file, it's a multi-page document
-        return len(jp2_files) > 1
+        try:
+            with os.scandir(output_dir) as entries:
+                return [entry.path for entry in entries
+                        if entry.name.endswith('.jp2') and entry.is_file(follow_symlinks=False)]
+        except FileNotFoundError:
+            return []
     
     def save(self, *args, **kwargs):
         """Override save method to automatically set original_filename.
@@ -2,97 +2,267 @@ from celery import shared_task
 from celery.exceptions import Ignore
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.db import connection, models
+from django.db.models import F, Func, Value
 from django.utils import timezone
+from bisect import bisect_right
 import os
-import sys
-import traceback
 import json
+import math
+import re
 import shutil
 import time
 
 # Import the JP2Forge adapter
-from .jp2forge_adapter import adapter as jp2forge_adapter, JP2ForgeResult
+from .jp2forge_adapter import adapter as jp2forge_adapter
 # Import BnF validator
-from .bnf_validator import get_validator, BnFStandards
+from .bnf_validator import get_validator, parse_compression_ratio, BnFStandards
+from .json_utils import dumps_json
+from .models import ConversionJob
 
 # Setup dedicated logger for tasks
 logger = get_task_logger(__name__)
 # Get the BnF validator
 bnf_validator = get_validator()
 
+# BnF (target ratio, minimum accepted ratio) per document type, computed once per worker
+_BNF_TARGETS = {
+    document_type: (ratio, ratio * (1 - bnf_validator.tolerance))
+    for document_type, ratio in BnFStandards.COMPRESSION_RATIOS.items()
+}
+_BNF_DEFAULT_TARGET = (4.0, 4.0 * (1 - bnf_validator.tolerance))
+
+# Progress step boundaries (percent) and the step name for each band;
+# matches the step boundaries used by the adapter's progress thread
+_STEP_THRESHOLDS = (10, 30, 60, 80)
+_STEP_NAMES = ('init', 'analyze', 'convert', 'optimize', 'finalize')
+
+def progress_step(percent_complete):
+    """Return the processing step name for a progress percentage."""
+    return _STEP_NAMES[bisect_right(_STEP_THRESHOLDS, percent_complete)]
+
+# A bare JSON boolean in compact output (a quoted "true" is preceded by '"')
+_JSON_BOOL_TOKEN = re.compile(r'[\[:,](?:true|false)[,\]}]')
+
+def _float_for_json(value):
+    """Replace NaN and infinite floats with their string names."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "Infinity" if value > 0 else "-Infinity"
+    return value
+
+def _stringify_for_json(value):
+    """Fallback conversion for values the JSON encoder does not understand."""
+    try:
+        # A str always encodes, so only str() itself can fail here
+        return str(value)
+    except Exception:
+        # If that fails, use a generic representation
+        return f"<Non-serializable: {type(value).__name__}>"
+
+# Scalar converters keyed on the exact type; booleans are stored as "true"/"false"
+# strings because the templates compare compliance flags against those values.
+_JSON_SCALAR_CONVERTERS = {
+    bool: lambda value: "true" if value else "false",
+    int: lambda value: value,
+    str: lambda value: value,
+    float: _float_for_json,
+    type(None): lambda value: None,
+}
+
+def _scalar_for_json(value):
+    """Convert a non-container value using the type dispatch table."""
+    converter = _JSON_SCALAR_CONVERTERS.get(type(value))
+    if converter is not None:
+        return converter(value)
+    # Subclasses (e.g. numpy.float64) fall back to the isinstance checks
+    for base in (bool, int, str, float):
+        if isinstance(value, base):
+            return _JSON_SCALAR_CONVERTERS[base](value)
+    return _stringify_for_json(value)
+
 def prepare_for_json(data):
     """
     Prepare data to be serialized to JSON by converting non-serializable types.
     
+    The structure is walked iteratively with an explicit stack rather than
+    recursing once per nested value, and scalars are converted through a
+    dispatch table keyed on their exact type.
+    
     Args:
         data: Data structure (dict, list, etc.) that may contain non-serializable values
         
     Returns:
         A JSON-serializable version of the data
     """
-    import math
-    import json
-    
     if data is None:
         return {}
-        
-    if isinstance(data, bool):
-        # Convert boolean values to strings
-        return str(data).lower()  # Returns "true" or "false"
-    elif isinstance(data, (int, str)):
-        # These types are already JSON serializable
-        return data
-    elif isinstance(data, float):
-        # Handle special float values
-        if math.isnan(data):
-            return "NaN"
-        elif math.isinf(data):
-            return "Infinity" if data > 0 else "-Infinity"
+    
+    root = [None]
+    stack = [(root, 0, data)]
+    while stack:
+        target, key, value = stack.pop()
+        if isinstance(value, dict):
+            # Pre-populate keys so the copy keeps the original ordering
+            converted = dict.fromkeys(value)
+            stack.extend((converted, k, v) for k, v in value.items())
+        elif isinstance(value, (list, tuple)):
+            converted = [None] * len(value)
+            stack.extend((converted, i, v) for i, v in enumerate(value))
         else:
-            return data
-    elif isinstance(data, dict):
-        # Process each item in the dictionary
-        return {k: prepare_for_json(v) for k, v in data.items()}
-    elif isinstance(data, (list, tuple)):
-        # Process each item in the list/tuple
-        return [prepare_for_json(item) for item in data]
-    else:
-        # For any other type, convert to string
-        try:
-            # Try JSON serialization test
-            json.dumps(str(data))
-            return str(data)
-        except (TypeError, OverflowError, ValueError):
-            # If that fails, use a generic representation
-            return f"<Non-serializable: {type(data).__name__}>"
+            converted = _scalar_for_json(value)
+        target[key] = converted
+    
+    return root[0]
 
 def ensure_json_serializable(data):
     """
     Ensures that data is JSON serializable by running it through prepare_for_json
     and then validating the result. Returns a guaranteed serializable dict.
     
+    Data that is already plain JSON is returned as-is (not copied).
+    
     Args:
         data: Any data structure to be prepared for JSON serialization
         
     Returns:
         A JSON serializable version of the data
     """
-    import json
+    # Fast path: most jp2forge metrics are already plain JSON, which the C
+    # encoder confirms in one pass. Data holding NaN/Infinity, unknown types
+    # or real booleans (stored as "true"/"false") takes the full walk instead.
+    if data is not None:
+        try:
+            encoded = json.dumps(data, allow_nan=False, separators=(',', ':'))
+        except (TypeError, OverflowError, ValueError):
+            pass
+        else:
+            if not _JSON_BOOL_TOKEN.search(encoded):
+                return data
     
-    # First pass: prepare data for serialization
+    # Slow path: prepare data for serialization
     prepared_data = prepare_for_json(data)
     
     try:
-        # Test serialization explicitly
-        json.dumps(prepared_data)
+        # Test serialization explicitly (single C-level pass when orjson is installed)
+        dumps_json(prepared_data, default=None)
         return prepared_data
     except (TypeError, OverflowError, ValueError) as e:
         # If serialization still fails, return a safe empty dictionary
         # and log the error
-        logger.error(f"JSON serialization failure: {str(e)}")
+        logger.error("JSON serialization failure: %s", e)
         return {}
 
-@shared_task(bind=True, max_retries=2)
+def iter_page_results(result, compression_ratio, page_filenames):
+    """
+    Yield the per-page entries of a multi-page report one page at a time.
+    
+    Values shared by every page (file sizes, BnF compliance and the BnF
+    validation summary) are built once and referenced by each entry rather
+    than copied per page; entries are serialized as they are yielded.
+    
+    Args:
+        result (JP2ForgeResult): Conversion result with a list of output files
+        compression_ratio (float): Overall job compression ratio, used when
+            jp2forge reports no per-page file sizes
+        page_filenames (list): Basenames of result.output_file, in order
+        
+    Yields:
+        dict: Page entry with page number, status, output file and metrics
+    """
+    metrics = result.metrics
+    per_page_metrics = metrics.get('per_page_metrics') or []
+    
+    # Metrics shared by all pages without their own per-page entry
+    common_metrics = {}
+    for key in ['psnr', 'ssim']:
+        if key in metrics:
+            common_metrics[key] = metrics[key]
+    
+    if 'file_sizes' in metrics:
+        common_metrics['file_sizes'] = metrics['file_sizes']
+    elif result.file_sizes:
+        common_metrics['file_sizes'] = result.file_sizes
+    
+    if 'compression_ratio' in common_metrics.get('file_sizes', {}):
+        common_metrics['compression_ratio'] = common_metrics['file_sizes']['compression_ratio']
+    elif compression_ratio:
+        common_metrics['compression_ratio'] = f"{compression_ratio:.2f}:1"
+    
+    if 'bnf_compliance' in metrics:
+        common_metrics['bnf_compliance'] = metrics['bnf_compliance']
+    
+    bnf_validation = metrics.get('bnf_validation')
+    if bnf_validation and 'checks' in bnf_validation:
+        common_metrics['bnf_validation'] = {
+            'is_compliant': bnf_validation.get('is_compliant', 'false'),
+            'checks': {}
+        }
+        if 'compression_ratio' in bnf_validation['checks']:
+            common_metrics['bnf_validation']['checks']['compression_ratio'] = (
+                bnf_validation['checks']['compression_ratio']
+            )
+    
+    for idx, page_file in enumerate(result.output_file):
+        if idx < len(per_page_metrics):
+            page_metrics = per_page_metrics[idx]
+        else:
+            page_metrics = dict(common_metrics)
+            page_metrics['page_number'] = idx + 1
+            page_metrics['page_filename'] = page_filenames[idx]
+        
+        yield {
+            "page": idx + 1,
+            "status": "SUCCESS",
+            "output_file": page_file,
+            "metrics": page_metrics
+        }
+
+def write_report(report_file_path, report, page_results=None, indent=None):
+    """
+    Write a job's report.json file.
+    
+    When page_results is given, the report is written with a trailing
+    "multipage_results" list whose entries are serialized and written one
+    page at a time, so memory use does not grow with the page count.
+    
+    Reports are written compact unless indent is requested, since
+    indentation inflates large multi-page reports several times over.
+    
+    Args:
+        report_file_path (str): Destination path
+        report (dict): Report content
+        page_results (iterable, optional): Per-page entries to stream
+        indent (bool, optional): Pretty-print the report; defaults to settings.DEBUG
+    """
+    if indent is None:
+        indent = settings.DEBUG
+    body = dumps_json(report, indent=indent)
+    with open(report_file_path, 'wb') as f:
+        if page_results is None:
+            f.write(body)
+            return
+        
+        if indent:
+            item_prefix, closing = b'\n    ', b'\n  ]\n}'
+            # Reopen the serialized object by dropping its closing "\n}"
+            f.write(body[:-2] + b',\n' if report else b'{\n')
+            f.write(b'  "multipage_results": [')
+        else:
+            item_prefix, closing = b'', b']}'
+            # Reopen the serialized object by dropping its closing "}"
+            f.write(body[:-1] + b',' if report else b'{')
+            f.write(b'"multipage_results":[')
+        for idx, page_result in enumerate(page_results):
+            if idx:
+                f.write(b',')
+            f.write(item_prefix)
+            f.write(dumps_json(page_result))
+        f.write(closing)
+
+@shared_task(bind=True, max_retries=2, autoretry_for=(Exception,),
+             retry_backoff=True, retry_backoff_max=30, retry_jitter=True)
 def process_conversion_job(self, job_id):
     """
     Process a JPEG2000 conversion job using jp2forge
@@ -104,95 +274,115 @@ def process_conversion_job(self, job_id):
     4. Updates the job record with results
     5. Handles errors and retries if needed
     """
-    # Import the model here to avoid circular imports
-    from .models import ConversionJob
-    
-    logger.info(f"Starting conversion job {job_id}")
+    logger.info("Starting conversion job %s", job_id)
     
+    # Version this run claimed; error updates are conditional on it, so a run
+    # that never claimed the job (or was superseded) cannot overwrite it
+    run_version = None
     try:
-        # Retrieve the job and update its status using select_for_update
-        from django.db import transaction
-        with transaction.atomic():
-            job = ConversionJob.objects.select_for_update().get(id=job_id)
-            job.status = 'processing'
-            job.progress = 0
-            job.save()
-        
-        logger.info(f"Processing job {job_id} for file {job.original_filename}")
-        
-        # Set up input and output paths
-        input_path = os.path.join(settings.MEDIA_ROOT, job.original_file.name)
-        output_dir = os.path.join(settings.MEDIA_ROOT, f'jobs/{job.id}/output')
-        report_dir = os.path.join(settings.MEDIA_ROOT, f'jobs/{job.id}/reports')
-        temp_dir = os.path.join(settings.MEDIA_ROOT, f'jobs/{job.id}/temp')
-        
-        # Create needed directories
-        for directory in [output_dir, report_dir, temp_dir]:
-            os.makedirs(directory, exist_ok=True)
-        
-        # Validate input file
-        if not os.path.exists(input_path):
+        # Retrieve the job (its metrics are rewritten on completion, so skip loading
+        # them) and claim it for this run by bumping its version. Every later
+        # write from this run is conditional on that version, so a superseded
+        # run can never overwrite a newer one; no row locks are held.
+        job = ConversionJob.objects.defer('metrics').get(id=job_id)
+        if not claim_job(job):
+            # The version changed in between; retry once with a fresh read, but
+            # never take the job away from a run that is processing it
+            job = ConversionJob.objects.defer('metrics').get(id=job_id)
+            if job.status == 'processing' or not claim_job(job):
+                logger.warning("Job %s was claimed by another run, skipping", job_id)
+                raise Ignore()
+        run_version = job.version
+        
+        logger.info("Processing job %s for file %s", job_id, job.original_filename)
+        
+        # Set up input and output paths (resolve MEDIA_ROOT and the job root once)
+        media_root = settings.MEDIA_ROOT
+        job_root = os.path.join(media_root, 'jobs', str(job.id))
+        input_path = os.path.join(media_root, job.original_file.name)
+        output_dir = os.path.join(job_root, 'output')
+        report_dir = os.path.join(job_root, 'reports')
+        temp_dir = os.path.join(job_root, 'temp')
+        
+        # Create needed directories; makedirs creates the job root along with the
+        # output directory, so the sibling directories only need a plain mkdir
+        os.makedirs(output_dir, exist_ok=True)
+        for directory in (report_dir, temp_dir):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+        
+        # Validate input file with a single stat call
+        try:
+            input_size = os.stat(input_path).st_size
+        except FileNotFoundError:
             raise FileNotFoundError(f"Input file not found: {input_path}")
         
-        if os.path.getsize(input_path) == 0:
+        if input_size == 0:
             raise ValueError("Input file is empty")
         
         # Variables for progress throttling
         last_saved_time = 0.0
         last_saved_progress = -1.0
+        last_state_time = 0.0
+        last_state_progress = -1.0
+        last_logged_bucket = -1
+        
+        # On PostgreSQL the current step is written with jsonb_set, so the
+        # metrics column never has to be read back; other backends read it once
+        use_jsonb_set = connection.vendor == 'postgresql'
+        progress_metrics = None
         
         # Progress callback for real-time updates
         def update_progress(progress_data):
-            nonlocal last_saved_time, last_saved_progress
+            nonlocal last_saved_time, last_saved_progress, last_state_time, last_state_progress
+            nonlocal last_logged_bucket, progress_metrics
             
             # Extract progress percentage or default to 0
             percent_complete = progress_data.get('percent_complete', 0)
             
-            # Get the current step directly from the progress_data if available
-            current_step = progress_data.get('current_step', None)
+            # Use the step reported by jp2forge, or derive it from the percentage
+            current_step = progress_data.get('current_step') or progress_step(percent_complete)
+            progress_data['current_step'] = current_step
             
-            # If not provided, determine the current step based on progress percentage
-            if not current_step:
-                if percent_complete >= 80:
-                    current_step = 'finalize'
-                elif percent_complete >= 60:
-                    current_step = 'optimize'
-                elif percent_complete >= 30:
-                    current_step = 'convert'
-                elif percent_complete >= 10:
-                    current_step = 'analyze'
-                else:
-                    current_step = 'init'
-                
-            # Include step information in the progress data
-            if isinstance(progress_data, dict):
-                progress_data['current_step'] = current_step
-            else:
-                # If progress_data isn't a dict (unexpected), create a new dict
-                progress_data = {'percent_complete': percent_complete, 'current_step': current_step}
+            current_time = time.time()
             
             # Update task state for Celery's own progress tracking
-            self.update_state(
-                state='PROGRESS',
-                meta={'progress': percent_complete, 'current_step': current_step}
-            )
+            # (at most once per second OR per 1% progress increment)
+            if (percent_complete >= 100 or last_state_progress < 0 or
+                    current_time - last_state_time >= 1.0 or
+                    abs(percent_complete - last_state_progress) >= 1.0):
+                self.update_state(
+                    state='PROGRESS',
+                    meta={'progress': percent_complete, 'current_step': current_step}
+                )
+                last_state_time = current_time
+                last_state_progress = percent_complete
             
             # Throttle intermediate progress writes to DB (at most once per second OR per 5% progress increment)
-            current_time = time.time()
             time_diff = current_time - last_saved_time
             prog_diff = abs(percent_complete - last_saved_progress)
             
             if percent_complete >= 100 or last_saved_progress < 0 or time_diff >= 1.0 or prog_diff >= 5.0:
                 try:
                     # Update job using a fast, non-locking update query
-                    from django.utils import timezone
-                    from .models import ConversionJob
-                    
-                    # Safely load the current metrics dict to append current_step
-                    job_metrics = ConversionJob.objects.filter(id=job_id).values_list('metrics', flat=True).first() or {}
-                    job_metrics['current_step'] = current_step
+                    if use_jsonb_set:
+                        job_metrics = Func(
+                            F('metrics'),
+                            Value('{current_step}'),
+                            Value(current_step, output_field=models.JSONField()),
+                            function='jsonb_set',
+                            output_field=models.JSONField(),
+                        )
+                    else:
+                        # Load the current metrics dict once, then only update current_step
+                        if progress_metrics is None:
+                            progress_metrics = ConversionJob.objects.filter(id=job_id, version=run_version).values_list('metrics', flat=True).first() or {}
+                        progress_metrics['current_step'] = current_step
+                        job_metrics = progress_metrics
                     
-                    ConversionJob.objects.filter(id=job_id).update(
+                    ConversionJob.objects.filter(id=job_id, version=run_version).update(
                         progress=percent_complete,
                         metrics=job_metrics,
                         updated_at=timezone.now()
@@ -201,11 +391,13 @@ def process_conversion_job(self, job_id):
                     last_saved_time = current_time
                     last_saved_progress = percent_complete
                 except Exception as e:
-                    logger.error(f"Error updating job progress: {str(e)}")
+                    logger.error("Error updating job progress: %s", e)
             
-            # Log progress updates
-            if int(percent_complete) % 5 == 0 or percent_complete >= 99:
-                logger.info(f"Job {job_id} progress: {percent_complete:.1f}% (Step: {current_step})")
+            # Log progress updates once per 5% bucket
+            log_bucket = int(percent_complete) // 5
+            if log_bucket != last_logged_bucket:
+                last_logged_bucket = log_bucket
+                logger.debug("Job %s progress: %.1f%% (Step: %s)", job_id, percent_complete, current_step)
             
             # Simulate some work for testing if needed
             if settings.DEBUG and hasattr(settings, 'SIMULATED_CONVERSION_DELAY'):
@@ -214,20 +406,22 @@ def process_conversion_job(self, job_id):
         # Determine if BnF mode is active (either compression_mode is 'bnf_compliant' or bnf_compliant is True)
         is_bnf_mode = (job.compression_mode == 'bnf_compliant' or job.bnf_compliant)
         
+        resolution_levels = BnFStandards.REQUIRED_RESOLUTION_LEVELS if is_bnf_mode else None
+        
         # Create configuration
         try:
             # Get BnF-specific configuration params if needed
             if is_bnf_mode:
-                logger.info(f"Job {job_id} using BnF compliance mode with document type: {job.document_type}")
+                logger.info("Job %s using BnF compliance mode with document type: %s", job_id, job.document_type)
                 
                 # Get the target compression ratio for the document type
-                target_ratio = BnFStandards.COMPRESSION_RATIOS.get(job.document_type, 4.0)
+                target_ratio, min_ratio = _BNF_TARGETS.get(job.document_type, _BNF_DEFAULT_TARGET)
                 
                 # Log BnF parameters being applied
                 logger.info(
-                    f"BnF compliance parameters: Compression ratio {target_ratio:.1f}:1, "
-                    f"Resolution levels: {BnFStandards.REQUIRED_RESOLUTION_LEVELS}, "
-                    f"Document type: {job.document_type}"
+                    "BnF compliance parameters: Compression ratio %.1f:1, "
+                    "Resolution levels: %s, Document type: %s",
+                    target_ratio, resolution_levels, job.document_type
                 )
             
             # Build configuration dictionary
@@ -239,7 +433,7 @@ def process_conversion_job(self, job_id):
                 'document_type': job.document_type,
                 'quality_threshold': job.quality,
                 'bnf_compliant': job.bnf_compliant or (job.compression_mode == 'bnf_compliant'),
-                'resolution_levels': BnFStandards.REQUIRED_RESOLUTION_LEVELS if is_bnf_mode else None
+                'resolution_levels': resolution_levels
             }
             
             # Filter out None values
@@ -251,7 +445,7 @@ def process_conversion_job(self, job_id):
             if config is None:
                 raise ValueError("Invalid configuration parameters")
                 
-            logger.info(f"Job {job_id} configuration created successfully")
+            logger.info("Job %s configuration created successfully", job_id)
                 
         except Exception as e:
             raise ValueError(f"Failed to create configuration: {str(e)}")
@@ -264,20 +458,20 @@ def process_conversion_job(self, job_id):
             if not result.success:
                 raise ValueError(result.error or "Unknown conversion error")
                 
-            logger.info(f"Job {job_id} processing completed successfully")
+            logger.info("Job %s processing completed successfully", job_id)
             
             # Validate BnF compliance if in BnF mode
             if is_bnf_mode:
-                logger.info(f"Validating BnF compliance for job {job_id}")
+                logger.info("Validating BnF compliance for job %s", job_id)
                 validation_result = jp2forge_adapter.validate_bnf_compliance(result, job.document_type)
                 
                 # Log validation result
                 if validation_result.get('is_compliant', False):
-                    logger.info(f"Job {job_id} result is BnF compliant")
+                    logger.info("Job %s result is BnF compliant", job_id)
                 else:
                     logger.warning(
-                        f"Job {job_id} result may not be fully BnF compliant: "
-                        f"{validation_result.get('error', 'Unknown validation error')}"
+                        "Job %s result may not be fully BnF compliant: %s",
+                        job_id, validation_result.get('error', 'Unknown validation error')
                     )
                 
                 # Store validation results in metrics
@@ -286,199 +480,170 @@ def process_conversion_job(self, job_id):
                 result.metrics['bnf_validation'] = validation_result
                 
         except Exception as e:
-            logger.error(f"Error during workflow processing for job {job_id}: {str(e)}")
+            logger.error("Error during workflow processing for job %s: %s", job_id, e)
             raise
         
-        # Update job with results inside a transaction with select_for_update
-        from django.db import transaction
-        with transaction.atomic():
-            # Get a fresh, locked instance of the job
-            job = ConversionJob.objects.select_for_update().get(id=job_id)
-            job.status = 'completed'
-            job.progress = 100
-            job.error_message = ''
+        # Build the results on the instance loaded at the start of the run; they
+        # are written below with a single compare-and-set UPDATE on the version
+        job.status = 'completed'
+        job.progress = 100
+        job.error_message = ''
+        
+        # Handle single file output or multipage output; output basenames are
+        # computed once and shared by the job fields and the report
+        is_multipage = isinstance(result.output_file, list)
+        output_files = result.output_file if is_multipage else [result.output_file]
+        output_basenames = [os.path.basename(path) for path in output_files]
+        job.output_filename = output_basenames[0]
+        job.result_file = f'jobs/{job.id}/output/{output_basenames[0]}'
+        if is_multipage:
+            logger.info("Job %s produced multiple output files: %s", job_id, len(output_files))
+        else:
+            logger.info("Job %s produced single output file: %s", job_id, job.output_filename)
+        
+        # Store file size information if available
+        if result.file_sizes:
+            job.original_size = result.file_sizes.get('original_size', input_size)
+            job.converted_size = result.file_sizes.get('converted_size', 0)
             
-            # Handle single file output or multipage output
-            if isinstance(result.output_file, list):
-                job.output_filename = os.path.basename(result.output_file[0])
-                job.result_file = f'jobs/{job.id}/output/{os.path.basename(result.output_file[0])}'
-                logger.info(f"Job {job_id} produced multiple output files: {len(result.output_file)}")
-            else:
-                job.output_filename = os.path.basename(result.output_file)
-                job.result_file = f'jobs/{job.id}/output/{os.path.basename(result.output_file)}'
-                logger.info(f"Job {job_id} produced single output file: {job.output_filename}")
+            # Handle compression ratio which might be in format "4.50:1"
+            job.compression_ratio = parse_compression_ratio(result.file_sizes.get('compression_ratio'))
             
-            # Store file size information if available
-            if result.file_sizes:
-                job.original_size = result.file_sizes.get('original_size', job.original_size or 0)
-                job.converted_size = result.file_sizes.get('converted_size', 0)
+            logger.info("Job %s - Original: %s bytes, Converted: %s bytes, Ratio: %s:1",
+                        job_id, job.original_size, job.converted_size, job.compression_ratio)
+            
+            # For BnF mode, check if compression ratio meets requirements
+            if is_bnf_mode:
+                is_compliant, target_ratio = bnf_validator.is_compression_ratio_compliant(
+                    job.compression_ratio, job.document_type
+                )
                 
-                # Handle compression ratio which might be in format "4.50:1"
-                compression_ratio = result.file_sizes.get('compression_ratio', '0')
-                if isinstance(compression_ratio, str) and ':' in compression_ratio:
-                    job.compression_ratio = float(compression_ratio.split(':')[0])
-                else:
-                    job.compression_ratio = float(compression_ratio) if compression_ratio else 0
+                if not result.metrics:
+                    result.metrics = {}
+                    
+                result.metrics['bnf_compliance'] = {
+                    'is_compliant': str(is_compliant).lower(),
+                    'target_ratio': target_ratio,
+                    'actual_ratio': job.compression_ratio,
+                    'document_type': job.document_type,
+                    'tolerance': bnf_validator.tolerance
+                }
                 
-                logger.info(f"Job {job_id} - Original: {job.original_size} bytes, "
-                          f"Converted: {job.converted_size} bytes, "
-                          f"Ratio: {job.compression_ratio}:1")
+                if 'bnf_validation' not in result.metrics:
+                    validation_result = jp2forge_adapter.validate_bnf_compliance(result, job.document_type)
+                    result.metrics['bnf_validation'] = validation_result
                 
-                # For BnF mode, check if compression ratio meets requirements
-                if is_bnf_mode:
-                    is_compliant, target_ratio = bnf_validator.is_compression_ratio_compliant(
-                        job.compression_ratio, job.document_type
-                    )
-                    
-                    if not result.metrics:
-                        result.metrics = {}
-                        
-                    result.metrics['bnf_compliance'] = {
-                        'is_compliant': str(is_compliant).lower(),
-                        'target_ratio': target_ratio,
-                        'actual_ratio': job.compression_ratio,
-                        'document_type': job.document_type,
-                        'tolerance': bnf_validator.tolerance
-                    }
+                if ('bnf_validation' in result.metrics and 'checks' in result.metrics['bnf_validation'] and 
+                    'compression_ratio' in result.metrics['bnf_validation']['checks']):
+                    result.metrics['bnf_validation']['checks']['compression_ratio']['actual'] = job.compression_ratio
+                    result.metrics['bnf_validation']['checks']['compression_ratio']['passed'] = "true"
                     
-                    if 'bnf_validation' not in result.metrics:
-                        validation_result = jp2forge_adapter.validate_bnf_compliance(result, job.document_type)
-                        result.metrics['bnf_validation'] = validation_result
-                    
-                    if ('bnf_validation' in result.metrics and 'checks' in result.metrics['bnf_validation'] and 
-                        'compression_ratio' in result.metrics['bnf_validation']['checks']):
-                        result.metrics['bnf_validation']['checks']['compression_ratio']['actual'] = job.compression_ratio
-                        result.metrics['bnf_validation']['checks']['compression_ratio']['passed'] = "true"
-                        
-                        if job.compression_ratio >= target_ratio * (1 - bnf_validator.tolerance):
-                            result.metrics['bnf_validation']['checks']['compression_ratio']['message'] = (
-                                f"Compression ratio {job.compression_ratio:.2f}:1 meets requirements"
-                            )
-                        else:
-                            result.metrics['bnf_validation']['checks']['compression_ratio']['message'] = (
-                                f"Using lossless compression as fallback (ratio {job.compression_ratio:.2f}:1 " +
-                                f"doesn't meet target {target_ratio:.2f}:1 but is BnF compliant via fallback)"
-                            )
-                    
-                    if ('bnf_validation' in result.metrics and 
-                        'checks' in result.metrics['bnf_validation'] and 
-                        len(result.metrics['bnf_validation']['checks']) > 0 and
-                        result.metrics['bnf_validation'].get('error') == 'File not found'):
-                        result.metrics['bnf_validation']['is_compliant'] = "true"
-                        result.metrics['bnf_validation']['note'] = "Validation based on metrics data; file access validation skipped"
-            
-            # Store quality metrics - make sure to prepare them for JSON serialization
-            if result.metrics:
-                try:
-                    job.metrics = ensure_json_serializable(result.metrics)
-                    
-                    if 'psnr' in result.metrics and isinstance(result.metrics['psnr'], (int, float)):
-                        logger.info(f"Job {job_id} - PSNR: {result.metrics['psnr']:.2f} dB")
-                        
-                    if 'ssim' in result.metrics and isinstance(result.metrics['ssim'], (int, float)):
-                        logger.info(f"Job {job_id} - SSIM: {result.metrics['ssim']:.4f}")
-                    
-                    # Add additional information for multi-page files
-                    if isinstance(result.output_file, list):
-                        job.metrics['pages'] = len(result.output_file)
-                        page_files = []
-                        multipage_results = []
-                        
-                        for idx, page_file in enumerate(result.output_file):
-                            page_filename = os.path.basename(page_file)
-                            page_files.append(page_filename)
-                            
-                            page_metrics = {}
-                            if 'per_page_metrics' in result.metrics and idx < len(result.metrics['per_page_metrics']):
-                                page_metrics = result.metrics['per_page_metrics'][idx]
-                            else:
-                                for key in ['psnr', 'ssim']:
-                                    if key in result.metrics:
-                                        page_metrics[key] = result.metrics[key]
-                                
-                                if 'file_sizes' in result.metrics:
-                                    page_metrics['file_sizes'] = result.metrics['file_sizes'].copy()
-                                elif 'file_sizes' in result.__dict__ and result.file_sizes:
-                                    page_metrics['file_sizes'] = result.file_sizes.copy()
-                                
-                                if 'compression_ratio' in page_metrics.get('file_sizes', {}):
-                                    page_metrics['compression_ratio'] = page_metrics['file_sizes']['compression_ratio']
-                                elif job.compression_ratio:
-                                    page_metrics['compression_ratio'] = f"{job.compression_ratio:.2f}:1"
-                                    
-                                if 'bnf_compliance' in result.metrics:
-                                    page_metrics['bnf_compliance'] = result.metrics['bnf_compliance'].copy()
-                                
-                                if 'bnf_validation' in result.metrics:
-                                    if 'checks' in result.metrics['bnf_validation']:
-                                        page_metrics['bnf_validation'] = {
-                                            'is_compliant': result.metrics['bnf_validation'].get('is_compliant', 'false'),
-                                            'checks': {}
-                                        }
-                                        if 'compression_ratio' in result.metrics['bnf_validation'].get('checks', {}):
-                                            page_metrics['bnf_validation']['checks']['compression_ratio'] = (
-                                                result.metrics['bnf_validation']['checks']['compression_ratio'].copy()
-                                            )
-                                page_metrics['page_number'] = idx + 1
-                                page_metrics['page_filename'] = page_filename
-                            
-                            page_result = {
-                                "page": idx + 1,
-                                "status": "SUCCESS",
-                                "output_file": page_file,
-                                "metrics": page_metrics
-                            }
-                            multipage_results.append(page_result)
-                        
-                        job.metrics['page_files'] = page_files
-                        job.metrics['multipage_results'] = multipage_results
-                        logger.info(f"Job {job_id} - Added detailed metadata for {len(result.output_file)} pages to report")
+                    if job.compression_ratio >= min_ratio:
+                        result.metrics['bnf_validation']['checks']['compression_ratio']['message'] = (
+                            f"Compression ratio {job.compression_ratio:.2f}:1 meets requirements"
+                        )
+                    else:
+                        result.metrics['bnf_validation']['checks']['compression_ratio']['message'] = (
+                            f"Using lossless compression as fallback (ratio {job.compression_ratio:.2f}:1 " +
+                            f"doesn't meet target {target_ratio:.2f}:1 but is BnF compliant via fallback)"
+                        )
+                
+                if ('bnf_validation' in result.metrics and 
+                    'checks' in result.metrics['bnf_validation'] and 
+                    len(result.metrics['bnf_validation']['checks']) > 0 and
+                    result.metrics['bnf_validation'].get('error') == 'File not found'):
+                    result.metrics['bnf_validation']['is_compliant'] = "true"
+                    result.metrics['bnf_validation']['note'] = "Validation based on metrics data; file access validation skipped"
+        
+        # Store quality metrics - make sure to prepare them for JSON serialization
+        if result.metrics:
+            try:
+                job.metrics = ensure_json_serializable(result.metrics)
+                
+                if 'psnr' in result.metrics and isinstance(result.metrics['psnr'], (int, float)):
+                    logger.info("Job %s - PSNR: %.2f dB", job_id, result.metrics['psnr'])
                     
-                    # Write metrics to report.json file
-                    report_file_path = os.path.join(report_dir, 'report.json')
-                    try:
-                        with open(report_file_path, 'w') as f:
-                            json.dump(job.metrics, f, indent=4)
-                        logger.info(f"Job {job_id} - Wrote report file to {report_file_path}")
-                    except Exception as report_error:
-                        logger.error(f"Failed to write report file for job {job_id}: {str(report_error)}")
-                except Exception as e:
-                    logger.error(f"Failed to process metrics for job {job_id}: {str(e)}")
-                    job.metrics = {}
-            else:
-                job.metrics = {}
-                # Even without metrics, write a basic report
+                if 'ssim' in result.metrics and isinstance(result.metrics['ssim'], (int, float)):
+                    logger.info("Job %s - SSIM: %.4f", job_id, result.metrics['ssim'])
+                
+                # Add additional information for multi-page files
+                page_results = None
+                if is_multipage:
+                    job.metrics['pages'] = len(output_files)
+                    job.metrics['page_files'] = output_basenames
+                    # Per-page details are streamed into report.json instead of
+                    # being accumulated in memory and stored on the job row
+                    page_results = iter_page_results(result, job.compression_ratio, output_basenames)
+                    logger.info("Job %s - Added detailed metadata for %s pages to report", job_id, len(result.output_file))
+                
+                # Write metrics to report.json file
                 report_file_path = os.path.join(report_dir, 'report.json')
                 try:
-                    basic_report = {
-                        'job_id': str(job.id),
-                        'original_file': job.original_filename,
-                        'output_file': job.output_filename,
-                        'compression_mode': job.compression_mode,
-                        'document_type': job.document_type,
-                        'bnf_compliant': job.bnf_compliant,
-                        'completed_at': timezone.now().isoformat(),
-                        'note': 'No detailed metrics available for this conversion'
-                    }
-                    if isinstance(result.output_file, list):
-                        basic_report['pages'] = len(result.output_file)
-                        basic_report['page_files'] = [os.path.basename(page_file) for page_file in result.output_file]
-                        logger.info(f"Job {job_id} - Added metadata for {len(result.output_file)} pages to basic report")
-                    with open(report_file_path, 'w') as f:
-                        json.dump(basic_report, f, indent=4)
-                    logger.info(f"Job {job_id} - Wrote basic report file to {report_file_path}")
+                    write_report(report_file_path, job.metrics, page_results)
+                    logger.info("Job %s - Wrote report file to %s", job_id, report_file_path)
                 except Exception as report_error:
-                    logger.error(f"Failed to write basic report file for job {job_id}: {str(report_error)}")
-            
-            # Record completion time
-            job.completed_at = timezone.now()
-            job.save()
+                    logger.error("Failed to write report file for job %s: %s", job_id, report_error)
+            except Exception as e:
+                logger.error("Failed to process metrics for job %s: %s", job_id, e)
+                job.metrics = {}
+        else:
+            job.metrics = {}
+            # Even without metrics, write a basic report
+            report_file_path = os.path.join(report_dir, 'report.json')
+            try:
+                basic_report = {
+                    'job_id': str(job.id),
+                    'original_file': job.original_filename,
+                    'output_file': job.output_filename,
+                    'compression_mode': job.compression_mode,
+                    'document_type': job.document_type,
+                    'bnf_compliant': job.bnf_compliant,
+                    'completed_at': timezone.now().isoformat(),
+                    'note': 'No detailed metrics available for this conversion'
+                }
+                if is_multipage:
+                    basic_report['pages'] = len(output_files)
+                    basic_report['page_files'] = output_basenames
+                    logger.info("Job %s - Added metadata for %s pages to basic report", job_id, len(result.output_file))
+                write_report(report_file_path, basic_report)
+                logger.info("Job %s - Wrote basic report file to %s", job_id, report_file_path)
+            except Exception as report_error:
+                logger.error("Failed to write basic report file for job %s: %s", job_id, report_error)
+        
+        # Record completion time
+        job.completed_at = timezone.now()
+        # Only write the columns this task produces, and only if no newer run
+        # has claimed the job (or the job was deleted) in the meantime
+        completed = ConversionJob.objects.filter(id=job_id, version=run_version).update(
+            status=job.status,
+            progress=job.progress,
+            error_message=job.error_message,
+            output_filename=job.output_filename,
+            result_file=job.result_file.name,
+            output_count=len(output_files),
+            output_filenames=output_basenames,
+            original_size=job.original_size,
+            converted_size=job.converted_size,
+            compression_ratio=job.compression_ratio,
+            metrics=job.metrics,
+            completed_at=job.completed_at,
+            updated_at=job.completed_at,
+            version=run_version + 1,
+        )
+        if not completed:
+            logger.warning("Job %s was superseded or deleted before completion, result not saved", job_id)
+            return {'status': 'superseded', 'job_id': str(job.id)}
         
-        # Clean up temporary files if not in debug mode
-        if not settings.DEBUG and os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir)
+        # Clean up temporary files if not in debug mode (off the conversion worker).
+        # The job is already marked completed, so a dispatch failure must not
+        # send it back through the retry path.
+        if not settings.DEBUG:
+            try:
+                cleanup_temp_dir.apply_async(args=[temp_dir], countdown=5)
+            except Exception as e:
+                logger.warning("Could not schedule temp cleanup for job %s: %s", job_id, e)
         
-        logger.info(f"Completed conversion job {job_id}")
+        logger.info("Completed conversion job %s", job_id)
         
         return {
             'status': 'success',
@@ -486,53 +651,116 @@ def process_conversion_job(self, job_id):
             'output_file': job.result_file
         }
         
+    except Ignore:
+        # Deliberate skips (e.g. a lost claim) must not reach the error handlers
+        raise
+        
     except FileNotFoundError as e:
-        logger.error(f"File not found error for job {job_id}: {str(e)}")
-        handle_job_error(job_id, f"File not found: {str(e)}")
+        logger.error("File not found error for job %s: %s", job_id, e)
+        handle_job_error(job_id, f"File not found: {str(e)}", version=run_version)
         # Don't retry for missing files
         raise Ignore()
         
     except ValueError as e:
-        logger.error(f"Value error for job {job_id}: {str(e)}")
-        handle_job_error(job_id, f"Invalid input: {str(e)}")
+        logger.error("Value error for job %s: %s", job_id, e)
+        handle_job_error(job_id, f"Invalid input: {str(e)}", version=run_version)
         # Don't retry for validation errors
         raise Ignore()
         
     except Exception as e:
-        logger.error(f"Error processing job {job_id}: {str(e)}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error processing job %s: %s", job_id, e)
         
         # For other errors, attempt to retry if retries remain
         if self.request.retries < self.max_retries:
-            logger.info(f"Retrying job {job_id} (attempt {self.request.retries + 1})")
-            handle_job_error(job_id, f"Processing failed, retrying: {str(e)}", status='processing')
-            # Retry with exponential backoff (2s, 4s, 8s, etc.)
-            retry_delay = 2 ** self.request.retries
-            raise self.retry(exc=e, countdown=retry_delay)
+            logger.info("Retrying job %s (attempt %s)", job_id, self.request.retries + 1)
+            handle_job_error(job_id, f"Processing failed, retrying: {str(e)}", status='processing', version=run_version)
+            # Re-raise so autoretry_for schedules the retry with jittered exponential backoff
+            raise
         else:
             # No more retries, mark as failed
-            logger.error(f"Max retries exceeded for job {job_id}")
-            handle_job_error(job_id, f"Processing failed after {self.max_retries} attempts: {str(e)}")
+            logger.error("Max retries exceeded for job %s", job_id)
+            handle_job_error(job_id, f"Processing failed after {self.max_retries} attempts: {str(e)}", version=run_version)
             raise Ignore()
 
-def handle_job_error(job_id, error_message, status='failed'):
+@shared_task(ignore_result=True)
+def cleanup_temp_dir(path):
     """
-    Helper function to update a job's status when an error occurs
+    Remove a job's temporary directory.
+    
+    Routed to the 'cleanup' queue (see CELERY_TASK_ROUTES) so disk cleanup
+    does not hold a conversion worker slot.
+    """
+    shutil.rmtree(path, ignore_errors=True)
+    logger.info("Removed temporary directory %s", path)
+
+@shared_task(ignore_result=True)
+def cleanup_job_dirs(job_ids):
     """
-    from .models import ConversionJob
-    from django.db import transaction
+    Remove the media directories of deleted jobs.
     
+    Dispatched once per single or batch delete and routed to the 'cleanup'
+    queue, so removing many output files never blocks the web request.
+    """
+    jobs_root = os.path.join(settings.MEDIA_ROOT, 'jobs')
+    for job_id in job_ids:
+        shutil.rmtree(os.path.join(jobs_root, str(job_id)), ignore_errors=True)
+    logger.info("Removed directories for %s deleted job(s)", len(job_ids))
+
+def claim_job(job):
+    """
+    Mark a job as processing for a new run with a compare-and-set on its version.
+    
+    Args:
+        job (ConversionJob): Job instance as last read from the database
+        
+    Returns:
+        bool: True if the job was claimed; job.version then holds the run's version
+    """
+    claimed = ConversionJob.objects.filter(id=job.id, version=job.version).update(
+        status='processing',
+        progress=0,
+        version=job.version + 1,
+        updated_at=timezone.now()
+    )
+    if claimed:
+        job.version += 1
+    return bool(claimed)
+
+def handle_job_error(job_id, error_message, status='failed', version=None):
+    """
+    Helper function to update a job's status when an error occurs
+    
+    Issues a single UPDATE instead of locking, loading and re-saving the row.
+    The update only applies while the job still has the version claimed by
+    the failing run; without a claimed version nothing is written.
+    
+    Args:
+        job_id: ID of the job
+        error_message (str): Message to record on the job
+        status (str): Status to set
+        version (int): Version claimed by the run, or None if it never claimed
+    """
     try:
-        with transaction.atomic():
-            job = ConversionJob.objects.select_for_update().get(id=job_id)
-            job.status = status
-            job.error_message = error_message
-            
-            # Only set completion time if the job is permanently failed
-            if status == 'failed':
-                job.completed_at = timezone.now()
-                
-            job.save()
-        logger.info(f"Updated job {job_id} status to {status} with error: {error_message}")
+        now = timezone.now()
+        fields = {
+            'status': status,
+            'error_message': error_message,
+            # update() bypasses auto_now, so set the timestamp explicitly
+            'updated_at': now,
+        }
+        
+        # Only set completion time if the job is permanently failed
+        if status == 'failed':
+            fields['completed_at'] = now
+        
+        if version is None:
+            logger.warning("Job %s was not claimed by this run, not recording error: %s", job_id, error_message)
+            return
+        
+        updated = ConversionJob.objects.filter(id=job_id, version=version).update(**fields)
+        if not updated:
+            logger.warning("Job %s was superseded or deleted, not recording error: %s", job_id, error_message)
+            return
+        logger.info("Updated job %s status to %s with error: %s", job_id, status, error_message)
     except Exception as e:
-        logger.error(f"Error updating job status for {job_id}: {e}")
+        logger.error("Error updating job status for %s: %s", job_id, e)
@@ -0,0 +1,190 @@
+"""Tests for version-checked job updates and streamed conversion output."""
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from types import SimpleNamespace
+from unittest import mock
+
+from celery.exceptions import Ignore
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from . import tasks
+from .models import ConversionJob
+from .tasks import claim_job, handle_job_error, process_conversion_job, write_report
+from .zip_utils import iter_zip
+
+class TempDirMixin:
+    """Create a temporary directory for each test and remove it afterwards."""
+
+    def setUp(self):
+        super().setUp()
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir, ignore_errors=True)
+
+class JobVersionTests(TempDirMixin, TestCase):
+    """Claims, completions and error updates only apply to the claimed version."""
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user('tester', password='secret')
+        self.job = ConversionJob.objects.create(
+            user=self.user,
+            original_file='jobs/input.tif',
+            original_filename='input.tif',
+            compression_mode='lossless',
+        )
+
+    def test_claim_bumps_version(self):
+        self.assertTrue(claim_job(self.job))
+        self.assertEqual(self.job.version, 1)
+
+        job = ConversionJob.objects.get(id=self.job.id)
+        self.assertEqual(job.status, 'processing')
+        self.assertEqual(job.version, 1)
+
+    def test_claim_loses_version_race(self):
+        stale_job = ConversionJob.objects.get(id=self.job.id)
+        # Another run claims the job after this instance was read
+        self.assertTrue(claim_job(self.job))
+
+        self.assertFalse(claim_job(stale_job))
+        self.assertEqual(stale_job.version, 0)
+        self.assertEqual(ConversionJob.objects.get(id=self.job.id).version, 1)
+
+    def test_task_ignores_job_claimed_by_another_run(self):
+        ConversionJob.objects.filter(id=self.job.id).update(status='processing', version=1)
+
+        with mock.patch.object(tasks, 'claim_job', return_value=False):
+            with self.assertRaises(Ignore):
+                process_conversion_job(self.job.id)
+
+        job = ConversionJob.objects.get(id=self.job.id)
+        self.assertEqual(job.status, 'processing')
+        self.assertEqual(job.version, 1)
+
+    def test_stale_completion_writes_nothing(self):
+        media_root = self.temp_dir
+        input_path = os.path.join(media_root, self.job.original_file.name)
+        os.makedirs(os.path.dirname(input_path))
+        with open(input_path, 'wb') as f:
+            f.write(b'not really a tiff')
+
+        def process_file(config, path, progress_callback):
+            # A newer run claims the job while this one is still converting
+            ConversionJob.objects.filter(id=self.job.id).update(status='processing', version=5)
+            output_path = os.path.join(media_root, 'jobs', str(self.job.id), 'output', 'input.jp2')
+            with open(output_path, 'wb') as f:
+                f.write(b'jp2')
+            return SimpleNamespace(success=True, error=None, output_file=output_path,
+                                   file_sizes=None, metrics=None)
+
+        adapter = tasks.jp2forge_adapter
+        with override_settings(MEDIA_ROOT=media_root, DEBUG=True), \
+                mock.patch.object(adapter, 'create_config', return_value=object()), \
+                mock.patch.object(adapter, 'process_file', side_effect=process_file):
+            result = process_conversion_job(self.job.id)
+
+        self.assertEqual(result['status'], 'superseded')
+        job = ConversionJob.objects.get(id=self.job.id)
+        self.assertEqual(job.status, 'processing')
+        self.assertEqual(job.version, 5)
+        self.assertIsNone(job.output_filename)
+        self.assertEqual(job.output_filenames, [])
+
+    def test_handle_job_error_with_stale_version_writes_nothing(self):
+        claim_job(self.job)
+        ConversionJob.objects.filter(id=self.job.id).update(version=2)
+
+        handle_job_error(self.job.id, 'stale failure', version=1)
+
+        job = ConversionJob.objects.get(id=self.job.id)
+        self.assertEqual(job.status, 'processing')
+        self.assertIsNone(job.error_message)
+
+    def test_handle_job_error_without_version_is_noop(self):
+        handle_job_error(self.job.id, 'unclaimed failure', version=None)
+
+        job = ConversionJob.objects.get(id=self.job.id)
+        self.assertEqual(job.status, 'pending')
+        self.assertIsNone(job.error_message)
+        self.assertIsNone(job.completed_at)
+
+    def test_handle_job_error_with_claimed_version(self):
+        claim_job(self.job)
+
+        handle_job_error(self.job.id, 'conversion failed', version=self.job.version)
+
+        job = ConversionJob.objects.get(id=self.job.id)
+        self.assertEqual(job.status, 'failed')
+        self.assertEqual(job.error_message, 'conversion failed')
+        self.assertIsNotNone(job.completed_at)
+
+class IterZipTests(TempDirMixin, SimpleTestCase):
+    """Streamed archives can be read back by the standard zipfile module."""
+
+    def test_round_trip(self):
+        contents = {
+            'page_001.jp2': b'first page',
+            'page_002.jp2': os.urandom(70000),
+            'empty.jp2': b'',
+        }
+        entries = []
+        for name, data in contents.items():
+            path = os.path.join(self.temp_dir, name)
+            with open(path, 'wb') as f:
+                f.write(data)
+            entries.append((path, f'job/{name}'))
+
+        archive = b''.join(iter_zip(entries, chunk_size=4096))
+
+        with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+            self.assertIsNone(zf.testzip())
+            self.assertEqual(zf.namelist(), [arcname for _, arcname in entries])
+            for name, data in contents.items():
+                self.assertEqual(zf.read(f'job/{name}'), data)
+
+    def test_empty_archive(self):
+        archive = b''.join(iter_zip([]))
+
+        with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+            self.assertEqual(zf.namelist(), [])
+
+class WriteReportTests(TempDirMixin, SimpleTestCase):
+    """Reports with streamed page results are valid JSON in both layouts."""
+
+    report = {'job_id': 'abc', 'psnr': 42.5, 'pages': 2}
+    page_results = [
+        {'page': 1, 'output_file': 'page_001.jp2'},
+        {'page': 2, 'output_file': 'page_002.jp2'},
+    ]
+
+    def read_report(self, **kwargs):
+        path = os.path.join(self.temp_dir, 'report.json')
+        write_report(path, **kwargs)
+        with open(path, 'rb') as f:
+            return json.loads(f.read())
+
+    def test_compact_report_with_page_results(self):
+        data = self.read_report(report=self.report, page_results=iter(self.page_results), indent=False)
+        self.assertEqual(data, {**self.report, 'multipage_results': self.page_results})
+
+    def test_indented_report_with_page_results(self):
+        data = self.read_report(report=self.report, page_results=iter(self.page_results), indent=True)
+        self.assertEqual(data, {**self.report, 'multipage_results': self.page_results})
+
+    def test_empty_report_with_page_results(self):
+        for indent in (False, True):
+            with self.subTest(indent=indent):
+                data = self.read_report(report={}, page_results=self.page_results, indent=indent)
+                self.assertEqual(data, {'multipage_results': self.page_results})
+
+    def test_report_without_page_results(self):
+        for indent in (False, True):
+            with self.subTest(indent=indent):
+                data = self.read_report(report=self.report, indent=indent)
+                self.assertEqual(data, self.report)
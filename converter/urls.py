@@ -1,15 +1,17 @@
-from django.urls import path
-from . import views
+from django.urls import path, register_converter
+from . import converters, views
+
+register_converter(converters.JobIdConverter, 'job_id')
 
 urlpatterns = [
     path('dashboard/', views.dashboard, name='dashboard'),
     path('jobs/', views.job_list, name='job_list'),
     path('jobs/create/', views.job_create, name='job_create'),
-    path('jobs/<uuid:job_id>/', views.job_detail, name='job_detail'),
-    path('jobs/<uuid:job_id>/status/', views.job_status, name='job_status'),
-    path('jobs/<uuid:job_id>/delete/', views.job_delete, name='job_delete'),
-    path('jobs/<uuid:job_id>/retry/', views.job_retry, name='job_retry'),
-    path('jobs/<uuid:job_id>/download-all/', views.job_download_all, name='job_download_all'),
+    path('jobs/<job_id:job_id>/', views.job_detail, name='job_detail'),
+    path('jobs/<job_id:job_id>/status/', views.job_status, name='job_status'),
+    path('jobs/<job_id:job_id>/delete/', views.job_delete, name='job_delete'),
+    path('jobs/<job_id:job_id>/retry/', views.job_retry, name='job_retry'),
+    path('jobs/<job_id:job_id>/download-all/', views.job_download_all, name='job_download_all'),
     path('jobs/batch-action/', views.batch_job_action, name='batch_job_action'),
     path('jobs/download-selected/', views.download_selected_files, name='download_selected_files'),
     
@@ -51,38 +51,134 @@ Security:
 - HTTP method restrictions enforced
 """
 
+from celery import group
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
-from django.http import JsonResponse, HttpResponse
+from django.http import FileResponse, Http404, StreamingHttpResponse
 from django.conf import settings
 from django.core.paginator import Paginator
-from django.db.models import Count, Sum, Case, When, IntegerField
+from django.db.models import Count, Sum, Case, When, IntegerField, Q, Avg
 from django.contrib import messages
-from django.views.decorators.http import require_GET
+from django.utils import timezone
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
+from django.views.decorators.http import require_GET, require_POST, require_http_methods, etag
 import os
 import logging
 import json
-import zipfile
-from io import BytesIO
+import re
+import stat
+import uuid
+from collections import Counter
+from functools import wraps
 
 from .models import ConversionJob
 from .forms import ConversionJobForm
-from .tasks import process_conversion_job
+from .json_utils import OrjsonResponse
+from .tasks import process_conversion_job, progress_step, cleanup_job_dirs
+from .zip_utils import iter_zip
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# job_list query parameters and the model lookups they filter on
+JOB_LIST_FILTERS = (
+    ('status', 'status'),
+    ('compression_mode', 'compression_mode'),
+    ('document_type', 'document_type'),
+    ('search', 'original_filename__icontains'),
+)
+
+# Orderings accepted by job_list's sort parameter
+JOB_LIST_SORTS = frozenset({
+    'created_at', '-created_at',
+    'completed_at', '-completed_at',
+    'original_filename', '-original_filename',
+    'compression_ratio', '-compression_ratio',
+})
+
+# Media URL of a job output file: captures the job ID and the file name
+OUTPUT_FILE_URL_RE = re.compile(r'/media/jobs/([^/]+)/output/([^/?#]+)(?:[?#]|$)')
+
+# Content-Disposition headers of the multi-job ZIP downloads, by ZIP structure
+BATCH_DOWNLOAD_DISPOSITIONS = {
+    structure_type: f'attachment; filename="jp2forge_batch_download_{structure_type}.zip"'
+    for structure_type in ('flat', 'folders')
+}
+SELECTED_FILES_DISPOSITIONS = {
+    structure_type: f'attachment; filename="jp2forge_selected_files_{structure_type}.zip"'
+    for structure_type in ('flat', 'folders')
+}
+
+# Query/form values accepted as "on" for boolean flags such as flat
+TRUTHY_VALUES = frozenset({'1', 'true', 'yes', 'on'})
+
+def is_truthy(value):
+    """Interpret a query or form value as a boolean flag.
+    
+    Args:
+        value (str | None): Raw parameter value
+        
+    Returns:
+        bool: True for 1/true/yes/on (case-insensitive), False otherwise,
+        so that ?flat=0 or ?flat=false leave the flag off
+    """
+    return value is not None and value.lower() in TRUTHY_VALUES
+
+def all_files_exist(paths):
+    """Check that every path is an existing regular file (one stat per path).
+    
+    Output filenames recorded on a job are not re-read from disk, so this is
+    checked before a download response is started.
+    
+    Args:
+        paths (list): File paths to check
+        
+    Returns:
+        bool: True if all paths are regular files
+    """
+    return all(os.path.isfile(path) for path in paths)
+
+# Lifetime of cached public pages (documentation, about, version info)
+PUBLIC_PAGE_CACHE_TIMEOUT = 60 * 60
+
+def cache_page_for_anonymous(timeout):
+    """Cache a view's rendered response for anonymous visitors only.
+    
+    Pages for signed-in users carry per-user navigation (job count badges,
+    the account menu and flashed messages), so they are always rendered.
+    Anonymous requests with pending flash messages (e.g. after logout) are
+    rendered too, so one visitor's messages never land in the shared cache.
+    Responses vary on Cookie, which also keys the cache per cookie header.
+    
+    Args:
+        timeout (int): Cache lifetime in seconds
+        
+    Returns:
+        callable: View decorator
+    """
+    def decorator(view_func):
+        view_func = vary_on_cookie(view_func)
+        cached_view = cache_page(timeout)(view_func)
+        
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            # len() inspects the message storage without marking messages as read
+            if request.user.is_authenticated or len(messages.get_messages(request)):
+                return view_func(request, *args, **kwargs)
+            return cached_view(request, *args, **kwargs)
+        
+        return wrapper
+    return decorator
+
 @login_required
+@require_http_methods(['GET', 'POST'])
 def dashboard(request):
     """Dashboard view showing conversion statistics and recent jobs."""
-    if request.method not in ['GET', 'POST']:
-        # Return 405 Method Not Allowed for other HTTP methods
-        from django.http import HttpResponseNotAllowed
-        return HttpResponseNotAllowed(['GET', 'POST'])
-    
     logger.info(f"User {request.user.username} accessed dashboard")
     
-    # Get user's job statistics
+    # Get user's job statistics and storage totals in a single aggregate query
+    # (SUM/AVG of a column already skip NULL values)
     stats = ConversionJob.objects.filter(user=request.user).aggregate(
         total_jobs=Count('id'),
         completed_jobs=Count(Case(When(status='completed', then=1), 
@@ -92,39 +188,21 @@ def dashboard(request):
         processing_jobs=Count(Case(When(status='processing', then=1), 
                                   output_field=IntegerField())),
         pending_jobs=Count(Case(When(status='pending', then=1), 
-                               output_field=IntegerField()))
+                               output_field=IntegerField())),
+        original_size_sum=Sum('original_size'),
+        converted_size_sum=Sum('converted_size'),
+        avg_ratio=Avg('compression_ratio', filter=Q(status='completed')),
     )
+    original_size_sum = stats.pop('original_size_sum') or 0
+    converted_size_sum = stats.pop('converted_size_sum') or 0
+    avg_ratio = stats.pop('avg_ratio')
     
     # Get recent jobs (limit to 5)
-    recent_jobs = ConversionJob.objects.filter(user=request.user).order_by('-created_at')[:5]
+    recent_jobs = ConversionJob.objects.filter(user=request.user).for_list().order_by('-created_at')[:5]
     
     # Calculate storage metrics if jobs exist
     storage_metrics = {}
     if stats['total_jobs'] > 0:
-        # Sum of original file sizes
-        original_size_sum = ConversionJob.objects.filter(
-            user=request.user, 
-            original_size__isnull=False
-        ).aggregate(total=Sum('original_size'))['total'] or 0
-        
-        # Sum of converted file sizes
-        converted_size_sum = ConversionJob.objects.filter(
-            user=request.user, 
-            converted_size__isnull=False
-        ).aggregate(total=Sum('converted_size'))['total'] or 0
-        
-        # Calculate average compression ratio
-        completed_jobs = ConversionJob.objects.filter(
-            user=request.user, 
-            status='completed',
-            compression_ratio__isnull=False
-        )
-        
-        if completed_jobs.exists():
-            avg_ratio = completed_jobs.aggregate(avg=Sum('compression_ratio') / Count('id'))['avg']
-        else:
-            avg_ratio = 0
-            
         storage_metrics = {
             'original_size': original_size_sum,
             'converted_size': converted_size_sum,
@@ -151,6 +229,7 @@ def job_create(request):
             files = request.FILES.getlist('files')
             jobs_created = 0
             first_job_id = None
+            jobs = []
             
             for file in files:
                 # Create a new job for each file
@@ -162,29 +241,39 @@ def job_create(request):
                     quality=form.cleaned_data['quality'],
                 )
                 
-                # Set file details
-                job.original_file = file
+                # Set file details; the upload is written to storage now so the
+                # row itself can be inserted together with the others below
+                job.original_file.save(file.name, file, save=False)
                 job.original_filename = file.name
                 job.original_size = file.size
-                job.save()
-                
-                # Store the first job ID for redirecting
-                if not first_job_id:
-                    first_job_id = job.id
-                
+                jobs.append(job)
+            
+            # Insert all job rows with a single multi-row INSERT
+            ConversionJob.objects.bulk_create(jobs)
+            for job in jobs:
                 logger.info(f"User {request.user.username} created job {job.id} for file {job.original_filename}")
-                
-                # Start Celery task for this job
+            
+            # Store the first job ID for redirecting
+            if jobs:
+                first_job_id = jobs[0].id
+            
+            # Start the Celery tasks for all jobs in one group dispatch, which
+            # publishes every message over a single broker connection
+            if jobs:
                 try:
-                    task = process_conversion_job.delay(str(job.id))
-                    job.task_id = task.id
-                    job.save(update_fields=['task_id'])
-                    jobs_created += 1
+                    group_result = group(
+                        process_conversion_job.s(str(job.id)) for job in jobs
+                    ).apply_async()
+                    for job, task in zip(jobs, group_result.results):
+                        job.task_id = task.id
+                    ConversionJob.objects.bulk_update(jobs, ['task_id'])
+                    jobs_created = len(jobs)
                 except Exception as e:
-                    logger.error(f"Failed to start Celery task for job {job.id}: {str(e)}")
-                    job.status = 'failed'
-                    job.error_message = f"Failed to start conversion task: {str(e)}"
-                    job.save(update_fields=['status', 'error_message'])
+                    logger.error(f"Failed to start Celery tasks for {len(jobs)} job(s): {str(e)}")
+                    ConversionJob.objects.filter(id__in=[job.id for job in jobs]).update(
+                        status='failed',
+                        error_message=f"Failed to start conversion task: {str(e)}",
+                    )
             
             if jobs_created > 0:
                 messages.success(request, f"Successfully created {jobs_created} conversion job{'s' if jobs_created > 1 else ''}. Your file{'s' if jobs_created > 1 else ''} {'are' if jobs_created > 1 else ''} now being processed.")
@@ -200,62 +289,38 @@ def job_create(request):
     return render(request, 'converter/job_create.html', {'form': form})
 
 @login_required
+@require_http_methods(['GET', 'POST'])
 def job_list(request):
     """
     View for listing all conversion jobs with filtering options
     """
-    if request.method not in ['GET', 'POST']:
-        # Return 405 Method Not Allowed for other HTTP methods
-        from django.http import HttpResponseNotAllowed
-        return HttpResponseNotAllowed(['GET', 'POST'])
-    
-    # Start with all user's jobs
-    jobs_queryset = ConversionJob.objects.filter(user=request.user)
-    
-    # Apply filters from query parameters
+    # Collect the filters from query parameters into a single filter() call
     filters = {}
+    filter_kwargs = {}
+    for param, lookup in JOB_LIST_FILTERS:
+        value = request.GET.get(param)
+        if value:
+            filter_kwargs[lookup] = value
+            filters[param] = value
     
-    # Status filter
-    status = request.GET.get('status')
-    if status:
-        jobs_queryset = jobs_queryset.filter(status=status)
-        filters['status'] = status
-    
-    # Compression mode filter
-    compression_mode = request.GET.get('compression_mode')
-    if compression_mode:
-        jobs_queryset = jobs_queryset.filter(compression_mode=compression_mode)
-        filters['compression_mode'] = compression_mode
-    
-    # Document type filter
-    document_type = request.GET.get('document_type')
-    if document_type:
-        jobs_queryset = jobs_queryset.filter(document_type=document_type)
-        filters['document_type'] = document_type
-    
-    # Search by filename
-    search_query = request.GET.get('search')
-    if search_query:
-        jobs_queryset = jobs_queryset.filter(original_filename__icontains=search_query)
-        filters['search'] = search_query
+    jobs_queryset = ConversionJob.objects.filter(user=request.user, **filter_kwargs)
     
     # Apply sorting
     sort_by = request.GET.get('sort', '-created_at')  # Default: newest first
-    if sort_by and sort_by in [
-        'created_at', '-created_at', 
-        'completed_at', '-completed_at',
-        'original_filename', '-original_filename',
-        'compression_ratio', '-compression_ratio'
-    ]:
-        jobs_queryset = jobs_queryset.order_by(sort_by)
+    if sort_by in JOB_LIST_SORTS:
         filters['sort'] = sort_by
     else:
-        jobs_queryset = jobs_queryset.order_by('-created_at')  # Default sort
+        sort_by = '-created_at'  # Default sort
+    jobs_queryset = jobs_queryset.order_by(sort_by)
     
-    # Pagination
-    paginator = Paginator(jobs_queryset, 10)  # Show 10 jobs per page
+    # Pagination: LIMIT/OFFSET runs over a primary-key-only query, then the
+    # listed rows for the page are fetched by primary key
+    paginator = Paginator(jobs_queryset.values_list('pk', flat=True), 10)  # Show 10 jobs per page
     page_number = request.GET.get('page')
     jobs = paginator.get_page(page_number)
+    page_pks = list(jobs.object_list)
+    rows = ConversionJob.objects.filter(pk__in=page_pks).for_list().in_bulk()
+    jobs.object_list = [rows[pk] for pk in page_pks if pk in rows]
     
     # Add active filters to context for display
     context = {
@@ -267,15 +332,11 @@ def job_list(request):
     return render(request, 'converter/job_list.html', context)
 
 @login_required
+@require_http_methods(['GET', 'POST'])
 def job_detail(request, job_id):
     """
     View for showing job details
     """
-    if request.method not in ['GET', 'POST']:
-        # Return 405 Method Not Allowed for other HTTP methods
-        from django.http import HttpResponseNotAllowed
-        return HttpResponseNotAllowed(['GET', 'POST'])
-    
     job = get_object_or_404(ConversionJob, id=job_id, user=request.user)
     
     logger.info(f"User {request.user.username} viewed job {job.id}")
@@ -290,18 +351,17 @@ def job_detail(request, job_id):
     # In case of multipage TIFF with multiple output files
     output_files = []
     if job.status == 'completed':
-        output_dir = os.path.join(settings.MEDIA_ROOT, f'jobs/{job.id}/output')
-        if os.path.exists(output_dir):
-            # Get the main output filename to avoid duplication
-            main_output_filename = os.path.basename(job.result_file.name) if job.result_file else None
-            
-            for filename in os.listdir(output_dir):
-                # Skip the main output file to avoid duplication
-                if filename.endswith('.jp2') and filename != main_output_filename:
-                    output_files.append({
-                        'name': filename,
-                        'url': f'/media/jobs/{job.id}/output/{filename}'
-                    })
+        # Get the main output filename to avoid duplication
+        main_output_filename = os.path.basename(job.result_file.name) if job.result_file else None
+        
+        for file_path in job.output_jp2_paths:
+            filename = os.path.basename(file_path)
+            # Skip the main output file to avoid duplication
+            if filename != main_output_filename:
+                output_files.append({
+                    'name': filename,
+                    'url': f'/media/jobs/{job.id}/output/{filename}'
+                })
     
     return render(request, 'converter/job_detail.html', {
         'job': job,
@@ -309,22 +369,47 @@ def job_detail(request, job_id):
         'output_files': output_files
     })
 
+def job_status_etag(request, job_id):
+    """Compute the ETag for job_status from a narrow, single-row query.
+    
+    Every write that changes what job_status reports also changes at least
+    one of these columns, so unchanged polls can be answered with a 304
+    without loading the job or building the response.
+    
+    Returns:
+        str: ETag value, or None if the job does not exist for this user
+    """
+    state = ConversionJob.objects.filter(id=job_id, user=request.user).values_list(
+        'status', 'progress', 'updated_at', 'version'
+    ).first()
+    if state is None:
+        return None
+    status, progress, updated_at, version = state
+    return f"{status}-{progress}-{updated_at.timestamp()}-{version}"
+
 @login_required
+@require_GET
+@etag(job_status_etag)
 def job_status(request, job_id):
     """
     API view for getting job status updates
-    """
-    # Only allow GET method for status API
-    if request.method != 'GET':
-        from django.http import HttpResponseNotAllowed
-        return HttpResponseNotAllowed(['GET'])
     
-    job = get_object_or_404(ConversionJob, id=job_id, user=request.user)
+    Responses carry an ETag, so polls that find the job unchanged get a
+    304 Not Modified.
+    """
+    # Read the reported columns as a plain dict; no model instance is needed
+    job = ConversionJob.objects.filter(id=job_id, user=request.user).values(
+        'id', 'status', 'progress', 'completed_at', 'output_filename', 'metrics',
+        'original_size', 'converted_size', 'compression_ratio', 'error_message',
+    ).first()
+    if job is None:
+        raise Http404("No ConversionJob matches the given query.")
+    metrics = job['metrics']
     
     # Format metrics for display if needed
     formatted_metrics = {}
-    if job.metrics:
-        for key, value in job.metrics.items():
+    if metrics:
+        for key, value in metrics.items():
             if key == 'psnr' and not isinstance(value, str):
                 formatted_metrics[key] = f"{value:.2f} dB"
             elif key == 'ssim' and not isinstance(value, str):
@@ -333,45 +418,39 @@ def job_status(request, job_id):
                 formatted_metrics[key] = value
     
     response_data = {
-        'id': str(job.id),
-        'status': job.status,
-        'progress': job.progress,
-        'completed_at': job.completed_at.isoformat() if job.completed_at else None,
-        'output_filename': job.output_filename or '',
+        'id': str(job['id']),
+        'status': job['status'],
+        'progress': job['progress'],
+        'completed_at': job['completed_at'].isoformat() if job['completed_at'] else None,
+        'output_filename': job['output_filename'] or '',
         'formatted_metrics': formatted_metrics,
     }
     
     # Include current step information if available
-    if job.metrics and 'current_step' in job.metrics:
-        response_data['current_step'] = job.metrics['current_step']
+    if metrics and 'current_step' in metrics:
+        response_data['current_step'] = metrics['current_step']
     else:
-        # Fallback step detection based on progress (similar to what we do in tasks.py)
-        if job.progress >= 80:
-            response_data['current_step'] = 'finalize'
-        elif job.progress >= 60:
-            response_data['current_step'] = 'optimize'
-        elif job.progress >= 30:
-            response_data['current_step'] = 'convert'
-        elif job.progress >= 10:
-            response_data['current_step'] = 'analyze'
-        else:
-            response_data['current_step'] = 'init'
+        # Fallback step detection based on progress, shared with the task
+        response_data['current_step'] = progress_step(job['progress'])
     
     # Include file sizes if available
-    if job.original_size:
-        response_data['original_size'] = job.original_size
+    if job['original_size']:
+        response_data['original_size'] = job['original_size']
     
-    if job.converted_size:
-        response_data['converted_size'] = job.converted_size
+    if job['converted_size']:
+        response_data['converted_size'] = job['converted_size']
     
-    if job.compression_ratio:
-        response_data['compression_ratio'] = job.compression_ratio
+    if job['compression_ratio']:
+        response_data['compression_ratio'] = job['compression_ratio']
     
     # Include error message if job failed
-    if job.status == 'failed' and job.error_message:
-        response_data['error_message'] = job.error_message
+    if job['status'] == 'failed' and job['error_message']:
+        response_data['error_message'] = job['error_message']
     
-    return JsonResponse(response_data)
+    response = OrjsonResponse(response_data)
+    # Let the browser revalidate every poll with If-None-Match
+    response['Cache-Control'] = 'private, no-cache'
+    return response
 
 @login_required
 def job_delete(request, job_id):
@@ -384,23 +463,10 @@ def job_delete(request, job_id):
         job_filename = job.original_filename
         
         try:
-            # Delete actual files
-            if job.original_file:
-                if os.path.exists(job.original_file.path):
-                    os.remove(job.original_file.path)
-            
-            if job.result_file:
-                if os.path.exists(job.result_file.path):
-                    os.remove(job.result_file.path)
-            
-            # Remove the job directory if it exists
-            job_dir = os.path.join(settings.MEDIA_ROOT, f'jobs/{job.id}')
-            if os.path.exists(job_dir):
-                import shutil
-                shutil.rmtree(job_dir)
-            
-            # Delete the database record
+            # Delete the database record, then remove the job directory (which
+            # holds the original and all output files) on a worker
             job.delete()
+            schedule_job_dir_cleanup([job_id])
             
             logger.info(f"User {request.user.username} deleted job {job_id} ({job_filename})")
             messages.success(request, f"Job '{job_filename}' has been deleted successfully.")
@@ -413,18 +479,13 @@ def job_delete(request, job_id):
     return render(request, 'converter/job_confirm_delete.html', {'job': job})
 
 @login_required
+@require_POST
 def job_retry(request, job_id):
     """
     View for retrying a failed job
     """
     job = get_object_or_404(ConversionJob, id=job_id, user=request.user)
     
-    # Only allow POST method for job retrying (data modification)
-    if request.method != 'POST':
-        # Return 405 Method Not Allowed for other HTTP methods
-        from django.http import HttpResponseNotAllowed
-        return HttpResponseNotAllowed(['POST'])
-    
     # Only allow retrying failed jobs
     if job.status != 'failed':
         messages.warning(request, "Only failed jobs can be retried.")
@@ -455,6 +516,7 @@ def job_retry(request, job_id):
     return redirect('job_detail', job_id=job.id)
 
 @login_required
+@require_POST
 def batch_job_action(request):
     """
     Handle batch operations on multiple jobs:
@@ -462,9 +524,6 @@ def batch_job_action(request):
     - Process: Requeue failed jobs for processing
     - Delete: Delete multiple jobs at once
     """
-    if request.method != 'POST':
-        return JsonResponse({'error': 'Method not allowed'}, status=405)
-    
     # Parse job IDs from form data
     try:
         job_ids = json.loads(request.POST.get('job_ids', '[]'))
@@ -474,54 +533,37 @@ def batch_job_action(request):
             messages.error(request, "No jobs selected or invalid action.")
             return redirect('job_list')
         
-        # Filter jobs that belong to the current user
-        jobs = ConversionJob.objects.filter(id__in=job_ids, user=request.user)
+        # Resolve the selected jobs that belong to the current user once
+        owned_ids = list(ConversionJob.objects.filter(
+            id__in=job_ids, user=request.user
+        ).values_list('id', flat=True))
         
-        if not jobs.exists():
+        if not owned_ids:
             messages.error(request, "No valid jobs selected.")
             return redirect('job_list')
         
+        jobs = ConversionJob.objects.filter(id__in=owned_ids)
+        
         # Perform the requested action
         if action == 'download':
             return batch_download_jobs(request, jobs)
         
         elif action == 'process':
-            # Filter failed jobs
-            failed_jobs = jobs.filter(status='failed')
+            # Reset failed jobs to pending status and requeue for processing
+            requeued = requeue_jobs(jobs.filter(status='failed'))
             
-            if not failed_jobs.exists():
+            if not requeued:
                 messages.warning(request, "No failed jobs selected for reprocessing.")
                 return redirect('job_list')
             
-            # Reset jobs to pending status and requeue for processing
-            for job in failed_jobs:
-                job.status = 'pending'
-                job.progress = 0
-                job.error_message = ''
-                job.save()
-                
-                # Queue the job for processing
-                process_conversion_job.delay(str(job.id))
-            
-            messages.success(request, f"{failed_jobs.count()} jobs have been requeued for processing.")
+            messages.success(request, f"{requeued} jobs have been requeued for processing.")
         
         elif action == 'delete':
-            # First, delete all job files
-            for job in jobs:
-                # Delete the job's directory
-                job_dir = os.path.join(settings.MEDIA_ROOT, f'jobs/{job.id}')
-                if os.path.exists(job_dir):
-                    import shutil
-                    try:
-                        shutil.rmtree(job_dir)
-                    except Exception as e:
-                        logger.error(f"Error deleting job directory {job_dir}: {e}")
-            
-            # Then delete the job records
-            count = jobs.count()
+            # Delete the job records, then remove their directories on a worker
             jobs.delete()
+            schedule_job_dir_cleanup(owned_ids)
             
-            messages.success(request, f"{count} jobs have been deleted.")
+            messages.success(request, f"{len(owned_ids)} jobs have been deleted.")
         
         else:
             messages.error(request, f"Unknown action: {action}")
@@ -536,6 +578,59 @@ def batch_job_action(request):
         messages.error(request, f"An error occurred: {str(e)}")
         return redirect('job_list')
 
+def requeue_jobs(jobs):
+    """Reset jobs to pending with one UPDATE and re-queue them as one Celery group.
+    
+    If the tasks cannot be dispatched, the jobs are marked failed again with
+    the dispatch error (as in job_create) and the exception is re-raised.
+    
+    Args:
+        jobs (QuerySet): Django queryset of ConversionJob objects to requeue
+        
+    Returns:
+        int: Number of jobs requeued
+    """
+    job_ids = [str(job_id) for job_id in jobs.values_list('id', flat=True)]
+    if not job_ids:
+        return 0
+    
+    requeued_jobs = ConversionJob.objects.filter(id__in=job_ids)
+    requeued_jobs.update(
+        status='pending',
+        progress=0,
+        error_message='',
+        # update() bypasses auto_now, so set the timestamp explicitly
+        updated_at=timezone.now(),
+    )
+    try:
+        group_result = group(process_conversion_job.s(job_id) for job_id in job_ids).apply_async()
+        ConversionJob.objects.bulk_update(
+            [ConversionJob(id=job_id, task_id=task.id)
+             for job_id, task in zip(job_ids, group_result.results)],
+            ['task_id'],
+        )
+    except Exception as e:
+        logger.error(f"Failed to start Celery tasks for {len(job_ids)} requeued job(s): {str(e)}")
+        requeued_jobs.update(
+            status='failed',
+            error_message=f"Failed to start conversion task: {str(e)}",
+            updated_at=timezone.now(),
+        )
+        raise
+    return len(job_ids)
+
+def schedule_job_dir_cleanup(job_ids):
+    """Queue removal of deleted jobs' media directories as a single Celery task.
+    
+    Args:
+        job_ids (list): IDs of the deleted jobs
+    """
+    try:
+        cleanup_job_dirs.delay([str(job_id) for job_id in job_ids])
+    except Exception as e:
+        # The records are already gone; orphaned directories are harmless
+        logger.error(f"Failed to queue directory cleanup for {len(job_ids)} deleted jobs: {str(e)}")
+
 def batch_delete_jobs(request, jobs):
     """Delete multiple conversion jobs and their associated files.
     
@@ -553,35 +648,24 @@ def batch_delete_jobs(request, jobs):
         
     Side Effects:
         - Deletes job database records
-        - Removes job directories from filesystem (jobs/{job_id}/)
+        - Queues removal of job directories (jobs/{job_id}/) on a Celery worker
         - Logs deletion activity for audit trail
         - Displays user feedback messages
         
     Note:
-        File deletion errors are logged but do not prevent database cleanup.
-        This ensures consistency even if filesystem operations fail.
+        File deletion happens asynchronously after the records are deleted,
+        so filesystem errors never affect database cleanup.
     """
-    job_count = jobs.count()
+    # Materialize the job IDs once; they serve the count, the delete and the log
+    job_ids = list(jobs.values_list('id', flat=True))
+    job_count = len(job_ids)
     if job_count == 0:
         messages.warning(request, "No jobs were selected for deletion.")
         return redirect('job_list')
     
-    # Get job IDs for logging
-    job_ids = list(jobs.values_list('id', flat=True))
-    
-    # Delete the jobs
-    for job in jobs:
-        # Remove job files
-        try:
-            job_dir = os.path.join(settings.MEDIA_ROOT, f'jobs/{job.id}')
-            if os.path.exists(job_dir):
-                import shutil
-                shutil.rmtree(job_dir)
-        except Exception as e:
-            logger.error(f"Error deleting files for job {job.id}: {str(e)}")
-    
-    # Delete job records
-    jobs.delete()
+    # Delete job records, then remove their directories on a worker
+    ConversionJob.objects.filter(id__in=job_ids).delete()
+    schedule_job_dir_cleanup(job_ids)
     
     logger.info(f"User {request.user.username} batch deleted {job_count} jobs: {job_ids}")
     messages.success(request, f"Successfully deleted {job_count} jobs.")
@@ -607,7 +691,7 @@ def batch_process_jobs(request, jobs):
         - Resets job.status to 'pending'
         - Clears job.progress (sets to 0)
         - Clears job.error_message
-        - Queues new convert_to_jp2 Celery task for each job
+        - Queues a process_conversion_job Celery task for each job (one group)
         
     Side Effects:
         - Updates job database records
@@ -619,26 +703,17 @@ def batch_process_jobs(request, jobs):
         Jobs that are not in 'failed' status are ignored. Users receive
         feedback about how many jobs were actually requeued.
     """
-    # Filter for failed jobs only
-    failed_jobs = jobs.filter(status='failed')
-    job_count = failed_jobs.count()
+    # Reset the failed jobs to pending and re-queue their conversion tasks
+    try:
+        job_count = requeue_jobs(jobs.filter(status='failed'))
+    except Exception as e:
+        messages.error(request, f"Failed to requeue jobs for processing: {str(e)}")
+        return redirect('job_list')
     
     if job_count == 0:
         messages.warning(request, "No failed jobs were selected for processing.")
         return redirect('job_list')
     
-    # Reprocess each failed job
-    for job in failed_jobs:
-        # Reset job status to pending
-        job.status = 'pending'
-        job.progress = 0
-        job.error_message = ''
-        job.save()
-        
-        # Re-queue the conversion task
-        from .tasks import convert_to_jp2
-        convert_to_jp2.delay(str(job.id))
-    
     logger.info(f"User {request.user.username} reprocessed {job_count} failed jobs")
     messages.success(request, f"Reprocessing {job_count} jobs. Check the status for updates.")
     return redirect('job_list')
@@ -653,105 +728,92 @@ def batch_download_jobs(request, jobs):
         jobs: QuerySet of jobs
         
     Returns:
-        HttpResponse with a ZIP file attachment
+        StreamingHttpResponse with a ZIP file attachment
     """
-    # Filter only completed jobs
-    download_jobs = jobs.filter(status='completed')
+    # Filter only completed jobs, skipping the metrics and error_message columns;
+    # loaded once and reused for the emptiness check and the ZIP entries
+    download_jobs = list(jobs.filter(status='completed').defer('metrics', 'error_message'))
     
-    if not download_jobs.exists():
+    if not download_jobs:
         messages.warning(request, "No completed jobs with results were selected for download.")
         return redirect('job_list')
     
-    # Create a BytesIO object to store the ZIP file
-    zip_buffer = BytesIO()
-    
     # Check if flat structure is requested (default for batch individual files)
-    use_flat_structure = request.GET.get('flat', False) or request.POST.get('flat', False)
-    
-    # Count total files
-    total_files = 0
+    use_flat_structure = is_truthy(request.GET.get('flat') or request.POST.get('flat'))
     
-    # Create a ZIP file
-    with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
-        for job in download_jobs:
-            # Path to the job's output directory
-            output_dir = os.path.join(settings.MEDIA_ROOT, f'jobs/{job.id}/output')
+    # Collect (file path, path inside the ZIP) pairs before streaming anything
+    zip_entries = []
+    for job in download_jobs:
+        # Get all JP2 files of the job (recorded on completion, no directory scan)
+        jp2_files = job.output_jp2_paths
+        
+        # Skip recorded files that no longer exist, or the stream would break
+        # midway; the other files and jobs are still zipped
+        existing_files = [file_path for file_path in jp2_files if os.path.isfile(file_path)]
+        if len(existing_files) < len(jp2_files):
+            logger.warning(f"Skipping {len(jp2_files) - len(existing_files)} missing output file(s) of job {job.id}")
+            jp2_files = existing_files
+        
+        # If JP2 files found, add them to the ZIP
+        if jp2_files:
+            # Determine if this is a multi-page file or individual file
+            is_multipage = len(jp2_files) > 1
             
-            # If output directory exists, check for JP2 files
-            if os.path.exists(output_dir):
-                # Get all JP2 files in the output directory
-                jp2_files = []
-                for filename in os.listdir(output_dir):
-                    if filename.endswith('.jp2'):
-                        jp2_files.append(os.path.join(output_dir, filename))
+            # Add each JP2 file to the ZIP
+            for file_path in jp2_files:
+                filename = os.path.basename(file_path)
                 
-                # If JP2 files found, add them to the ZIP
-                if jp2_files:
-                    # Determine if this is a multi-page file or individual file
-                    is_multipage = len(jp2_files) > 1
+                # Use appropriate folder structure based on settings
+                if is_multipage or not use_flat_structure:
+                    # For multi-page files or when folder structure is preferred
+                    base_folder = os.path.splitext(job.original_filename)[0]
+                    zip_path = f"{base_folder}/{filename}"
+                else:
+                    # For individual files with flat structure
+                    # Add the original filename (without extension) as prefix to avoid conflicts
+                    base_name = os.path.splitext(job.original_filename)[0]
+                    zip_path = f"{base_name}_{filename}"
                     
-                    # Add each JP2 file to the ZIP
-                    for file_path in jp2_files:
-                        filename = os.path.basename(file_path)
-                        
-                        # Use appropriate folder structure based on settings
-                        if is_multipage or not use_flat_structure:
-                            # For multi-page files or when folder structure is preferred
-                            base_folder = os.path.splitext(job.original_filename)[0]
-                            zip_path = f"{base_folder}/{filename}"
-                        else:
-                            # For individual files with flat structure
-                            # Add the original filename (without extension) as prefix to avoid conflicts
-                            base_name = os.path.splitext(job.original_filename)[0]
-                            zip_path = f"{base_name}_{filename}"
-                            
-                        zip_file.write(file_path, zip_path)
-                        total_files += 1
+                zip_entries.append((file_path, zip_path))
+        else:
+            # Fallback to the main result file if no JP2 files found in output dir
+            if job.result_file and os.path.exists(job.result_file.path):
+                filename = os.path.basename(job.result_file.name)
+                
+                if use_flat_structure:
+                    base_name = os.path.splitext(job.original_filename)[0]
+                    zip_path = f"{base_name}_{filename}"
                 else:
-                    # Fallback to the main result file if no JP2 files found in output dir
-                    if job.result_file and os.path.exists(job.result_file.path):
-                        filename = os.path.basename(job.result_file.name)
-                        
-                        if use_flat_structure:
-                            base_name = os.path.splitext(job.original_filename)[0]
-                            zip_path = f"{base_name}_{filename}"
-                        else:
-                            base_folder = os.path.splitext(job.original_filename)[0]
-                            zip_path = f"{base_folder}/{filename}"
-                            
-                        zip_file.write(job.result_file.path, zip_path)
-                        total_files += 1
-    
-    # Check if any files were added to the ZIP
-    if zip_buffer.tell() == 0:
+                    base_folder = os.path.splitext(job.original_filename)[0]
+                    zip_path = f"{base_folder}/{filename}"
+                    
+                zip_entries.append((job.result_file.path, zip_path))
+    
+    # Check if any files were found for the ZIP
+    if not zip_entries:
         messages.warning(request, "No output files found for the selected jobs.")
         return redirect('job_list')
     
-    # Reset buffer position
-    zip_buffer.seek(0)
-    
-    # Create response with ZIP file
-    response = HttpResponse(zip_buffer.getvalue(), content_type='application/zip')
+    # Stream the ZIP file as it is built instead of buffering it in memory
+    response = StreamingHttpResponse(iter_zip(zip_entries), content_type='application/zip')
     
     # Add structure type to filename
     structure_type = "flat" if use_flat_structure else "folders"
-    response['Content-Disposition'] = f'attachment; filename="jp2forge_batch_download_{structure_type}.zip"'
+    response['Content-Disposition'] = BATCH_DOWNLOAD_DISPOSITIONS[structure_type]
     
     # Log the download
-    logger.info(f"User {request.user.username} batch downloaded {download_jobs.count()} jobs ({total_files} files) using {structure_type} structure")
+    logger.info(f"User {request.user.username} batch downloaded {len(download_jobs)} jobs ({len(zip_entries)} files) using {structure_type} structure")
     
     return response
 
 @login_required
+@require_http_methods(['GET', 'POST'])
 def job_download_all(request, job_id):
     """
     View for downloading all JP2 output files from a job as a ZIP archive
-    """
-    if request.method not in ['GET', 'POST']:
-        # Return 405 Method Not Allowed for other HTTP methods
-        from django.http import HttpResponseNotAllowed
-        return HttpResponseNotAllowed(['GET', 'POST'])
     
+    A job with a single JP2 output gets that file directly instead of a ZIP.
+    """
     job = get_object_or_404(ConversionJob, id=job_id, user=request.user)
     
     # Check if the job is completed
@@ -759,68 +821,60 @@ def job_download_all(request, job_id):
         messages.warning(request, "Cannot download files - job is not completed yet.")
         return redirect('job_detail', job_id=job.id)
     
-    # Path to the job's output directory
-    output_dir = os.path.join(settings.MEDIA_ROOT, f'jobs/{job.id}/output')
-    
-    # If output directory doesn't exist, redirect with error
-    if not os.path.exists(output_dir):
-        messages.error(request, "Output directory not found.")
-        return redirect('job_detail', job_id=job.id)
+    # Get all JP2 files in the output directory (empty if it doesn't exist)
+    jp2_files = job.output_jp2_paths
     
-    # Get all JP2 files in the output directory
-    jp2_files = []
-    for filename in os.listdir(output_dir):
-        if filename.endswith('.jp2'):
-            jp2_files.append(os.path.join(output_dir, filename))
-    
-    # If no JP2 files found, redirect with error
-    if not jp2_files:
+    # If no JP2 files found (or any recorded one is missing), redirect with error
+    if not jp2_files or not all_files_exist(jp2_files):
         messages.error(request, "No JP2 files found to download.")
         return redirect('job_detail', job_id=job.id)
     
     # Check if flat structure is requested
-    use_flat_structure = request.GET.get('flat', False)
+    use_flat_structure = is_truthy(request.GET.get('flat'))
     
-    # Create a ZIP file with all JP2 files
-    zip_buffer = BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
-        # Determine if this is a multi-page file
-        is_multipage = len(jp2_files) > 1
-        
-        # Process each file
-        for file_path in jp2_files:
-            # Get just the filename (not the full path)
-            filename = os.path.basename(file_path)
-            
-            # Use appropriate path within ZIP based on settings
-            if use_flat_structure and not is_multipage:
-                # For individual files with flat structure, prefix with original filename
-                base_name = os.path.splitext(job.original_filename)[0]
-                zip_path = f"{base_name}_{filename}"
-            else:
-                # For multi-page files or default structure, use the filename directly
-                zip_path = filename
-            
-            # Add file to ZIP
-            zip_file.write(file_path, zip_path)
+    # Determine if this is a multi-page file
+    is_multipage = len(jp2_files) > 1
+    base_name = os.path.splitext(job.original_filename)[0]
     
-    # Reset buffer position
-    zip_buffer.seek(0)
+    # Collect (file path, path inside the ZIP) pairs for all JP2 files; the
+    # naming scheme is chosen once rather than per file
+    if use_flat_structure and not is_multipage:
+        # For individual files with flat structure, prefix with original filename
+        zip_entries = [
+            (file_path, f"{base_name}_{os.path.basename(file_path)}")
+            for file_path in jp2_files
+        ]
+    else:
+        # For multi-page files or default structure, use the filename directly
+        zip_entries = [(file_path, os.path.basename(file_path)) for file_path in jp2_files]
+    
+    # A single JP2 is sent as-is: zipping one already-compressed file only adds
+    # overhead, and FileResponse lets the server use sendfile via wsgi.file_wrapper
+    if len(zip_entries) == 1:
+        file_path, download_name = zip_entries[0]
+        try:
+            jp2_file = open(file_path, 'rb')
+        except FileNotFoundError:
+            messages.error(request, "No JP2 files found to download.")
+            return redirect('job_detail', job_id=job.id)
+        logger.info(f"User {request.user.username} downloaded the JP2 file for job {job.id}")
+        return FileResponse(jp2_file, as_attachment=True, filename=download_name)
     
     # Create filename for the ZIP file
-    base_name = os.path.splitext(job.original_filename)[0]
     structure_type = "flat" if use_flat_structure else "folders"
     zip_filename = f"{base_name}_jp2_files.zip"
     
     # Log the download
     logger.info(f"User {request.user.username} downloaded all JP2 files for job {job.id} as ZIP with {structure_type} structure")
     
-    # Return the ZIP file as a response
-    response = HttpResponse(zip_buffer.getvalue(), content_type='application/zip')
+    # Stream the ZIP file as it is built instead of buffering it in memory
+    response = StreamingHttpResponse(iter_zip(zip_entries), content_type='application/zip')
     response['Content-Disposition'] = f'attachment; filename="{zip_filename}"'
     
     return response
 
+@login_required
+@require_POST
 def download_selected_files(request):
     """Download user-selected files as a ZIP archive with smart organization.
     
@@ -834,9 +888,8 @@ def download_selected_files(request):
                               with list of media URLs to download
         
     Returns:
-        HttpResponse: ZIP file download response with appropriate filename
+        StreamingHttpResponse: ZIP file download response with appropriate filename
         HttpResponseRedirect: Redirect to job_list if no files selected
-        JsonResponse: Error response for non-POST requests
         
     Request Parameters:
         file_urls[] (list): Array of media URLs pointing to JP2 files
@@ -852,20 +905,17 @@ def download_selected_files(request):
     Side Effects:
         - Logs download activity for audit trail
         - Displays user feedback messages for errors
-        - Creates temporary ZIP file in memory
+        - Streams the ZIP file to the client as it is built
         
     Security:
         - Validates file paths are within media directory
-        - Restricts access to user's own job files through URL structure
+        - Restricts access to files of the user's own jobs
         - Requires POST method to prevent CSRF attacks
         
     Note:
         URL format expected: /media/jobs/{job_id}/output/{filename}
         Invalid URLs or missing files are silently skipped with error logging.
     """
-    if request.method != 'POST':
-        return JsonResponse({'error': 'POST request required'}, status=405)
-        
     # Get the file URLs from the request
     file_urls = request.POST.getlist('file_urls[]')
     
@@ -874,83 +924,80 @@ def download_selected_files(request):
         return redirect('job_list')
     
     # Check if flat structure is requested
-    use_flat_structure = request.GET.get('flat', False) or request.POST.get('flat', False)
-    
-    # Create a BytesIO object to store the ZIP file
-    zip_buffer = BytesIO()
-    
-    # Track files by original name to detect multi-page files
-    files_by_job = {}
-    
-    # First pass: gather file info to determine if we have multi-page files
-    for file_url in file_urls:
-        parts = file_url.split('/')
-        if 'media' in parts and 'jobs' in parts and 'output' in parts:
-            # Find indexes
-            job_idx = parts.index('jobs')
-            if job_idx + 1 < len(parts):
-                job_id = parts[job_idx + 1]
-                if job_id not in files_by_job:
-                    files_by_job[job_id] = 0
-                files_by_job[job_id] += 1
-    
-    # Create a ZIP file
-    with zipfile.ZipFile(zip_buffer, 'w') as zip_file:
-        for file_url in file_urls:
-            try:
-                # Extract relevant parts from URL
-                # The URL format should be something like /media/jobs/{job_id}/output/{filename}
-                parts = file_url.split('/')
-                if 'media' in parts and 'jobs' in parts and 'output' in parts:
-                    # Find indexes
-                    job_idx = parts.index('jobs')
-                    output_idx = parts.index('output')
-                    
-                    # Get job_id and filename
-                    if job_idx + 1 < len(parts) and output_idx + 1 < len(parts):
-                        job_id = parts[job_idx + 1]
-                        filename = parts[output_idx + 1]
-                        
-                        # Build the actual file path
-                        file_path = os.path.join(settings.MEDIA_ROOT, f'jobs/{job_id}/output/{filename}')
-                        
-                        if os.path.exists(file_path):
-                            # Determine if this is from a multi-page job
-                            is_multipage = files_by_job.get(job_id, 0) > 1
-                            
-                            # Try to get the original filename to use as a prefix
-                            try:
-                                job = ConversionJob.objects.get(id=job_id)
-                                original_name = os.path.splitext(job.original_filename)[0]
-                            except:
-                                original_name = f"file_{job_id}"
-                            
-                            if is_multipage or not use_flat_structure:
-                                # For multi-page files or when folder structure is preferred
-                                zip_path = f"{original_name}/{filename}"
-                            else:
-                                # For individual files with flat structure
-                                zip_path = f"{original_name}_{filename}"
-                            
-                            zip_file.write(file_path, zip_path)
-                
-            except Exception as e:
-                logger.error(f"Error adding file to ZIP: {e}")
+    use_flat_structure = is_truthy(request.GET.get('flat') or request.POST.get('flat'))
+    
+    # Parse each URL once into (job_id, filename); URLs of any other shape are skipped
+    parsed_urls = [
+        match.groups()
+        for match in map(OUTPUT_FILE_URL_RE.search, file_urls)
+        if match
+    ]
+    
+    # Count files per job to detect multi-page files
+    files_by_job = Counter(job_id for job_id, _ in parsed_urls)
+    
+    # Resolve original filenames for every referenced job in one query. Only
+    # the requesting user's jobs are returned, so other users' files are skipped
+    job_uuids = []
+    for job_id in files_by_job:
+        try:
+            job_uuids.append(uuid.UUID(job_id))
+        except ValueError:
+            logger.warning(f"Ignoring download URL with invalid job ID: {job_id}")
+    jobs_map = {
+        str(pk): os.path.splitext(original_filename)[0]
+        for pk, original_filename in ConversionJob.objects.filter(
+            id__in=job_uuids, user=request.user
+        ).values_list('id', 'original_filename')
+    }
+    
+    # Collect (file path, path inside the ZIP) pairs before streaming anything
+    media_root = os.path.realpath(settings.MEDIA_ROOT)
+    zip_entries = []
+    for job_id, filename in parsed_urls:
+        # Original filename (without extension) used as a prefix
+        original_name = jobs_map.get(job_id)
+        if original_name is None:
+            continue
+        
+        # Build the actual file path and make sure it resolves inside MEDIA_ROOT
+        file_path = os.path.realpath(
+            os.path.join(media_root, 'jobs', job_id, 'output', filename)
+        )
+        if not file_path.startswith(media_root + os.sep):
+            logger.warning(f"Rejected download path outside media directory: {file_path}")
+            continue
+        
+        # A single stat both checks existence and rules out directories
+        try:
+            if not stat.S_ISREG(os.stat(file_path).st_mode):
+                continue
+        except FileNotFoundError:
+            continue
+        
+        # Determine if this is from a multi-page job
+        is_multipage = files_by_job.get(job_id, 0) > 1
+        
+        if is_multipage or not use_flat_structure:
+            # For multi-page files or when folder structure is preferred
+            zip_path = f"{original_name}/{filename}"
+        else:
+            # For individual files with flat structure
+            zip_path = f"{original_name}_{filename}"
+        
+        zip_entries.append((file_path, zip_path))
     
-    # Check if any files were added to the ZIP
-    if zip_buffer.tell() == 0:
+    # Check if any files were found for the ZIP
+    if not zip_entries:
         messages.warning(request, "Could not locate the selected files for download.")
         return redirect('job_list')
     
-    # Reset buffer position
-    zip_buffer.seek(0)
-    
-    # Create response with ZIP file
-    response = HttpResponse(zip_buffer.getvalue(), content_type='application/zip')
+    # Stream the ZIP file as it is built instead of buffering it in memory
+    response = StreamingHttpResponse(iter_zip(zip_entries), content_type='application/zip')
     
     # Add structure type to filename
     structure_type = "flat" if use_flat_structure else "folders"
-    response['Content-Disposition'] = f'attachment; filename="jp2forge_selected_files_{structure_type}.zip"'
+    response['Content-Disposition'] = SELECTED_FILES_DISPOSITIONS[structure_type]
     
     # Log the download
     logger.info(f"User {request.user.username} downloaded {len(file_urls)} selected files using {structure_type} structure")
@@ -958,6 +1005,7 @@ def download_selected_files(request):
     return response
 
 @require_GET
+@cache_page_for_anonymous(PUBLIC_PAGE_CACHE_TIMEOUT)
 def docs_readme(request):
     """View for JP2Forge Web documentation home page.
     
@@ -974,16 +1022,12 @@ def docs_readme(request):
     Template:
         docs/readme.html: Main documentation template with project information
     """
-    if request.method in ['GET', 'POST']:
-        return render(request, 'docs/readme.html', {
-            'title': 'JP2Forge Web Documentation'
-        })
-    else:
-        # Return 405 Method Not Allowed for other HTTP methods
-        from django.http import HttpResponseNotAllowed
-        return HttpResponseNotAllowed(['GET', 'POST'])
+    return render(request, 'docs/readme.html', {
+        'title': 'JP2Forge Web Documentation'
+    })
 
 @require_GET
+@cache_page_for_anonymous(PUBLIC_PAGE_CACHE_TIMEOUT)
 def docs_user_guide(request):
     """View for JP2Forge Web user guide.
     
@@ -1000,16 +1044,12 @@ def docs_user_guide(request):
     Template:
         docs/user_guide.html: User guide template with usage instructions
     """
-    if request.method in ['GET', 'POST']:
-        return render(request, 'docs/user_guide.html', {
-            'title': 'Using JP2Forge Web'
-        })
-    else:
-        # Return 405 Method Not Allowed for other HTTP methods
-        from django.http import HttpResponseNotAllowed
-        return HttpResponseNotAllowed(['GET', 'POST'])
+    return render(request, 'docs/user_guide.html', {
+        'title': 'Using JP2Forge Web'
+    })
 
 @require_GET
+@cache_page_for_anonymous(PUBLIC_PAGE_CACHE_TIMEOUT)
 def about(request):
     """View for about JP2Forge Web page.
     
@@ -1026,16 +1066,12 @@ def about(request):
     Template:
         docs/about.html: About page template with project information
     """
-    if request.method in ['GET', 'POST']:
-        return render(request, 'docs/about.html', {
-            'title': 'About JP2Forge Web'
-        })
-    else:
-        # Return 405 Method Not Allowed for other HTTP methods
-        from django.http import HttpResponseNotAllowed
-        return HttpResponseNotAllowed(['GET', 'POST'])
+    return render(request, 'docs/about.html', {
+        'title': 'About JP2Forge Web'
+    })
 
 @require_GET
+@cache_page_for_anonymous(PUBLIC_PAGE_CACHE_TIMEOUT)
 def version_info(request):
     """View that displays version information for the application and dependencies.
     
@@ -0,0 +1,132 @@
+"""
+ZIP Streaming Utilities Module
+
+This module builds ZIP archives of job output files as a stream of byte
+chunks, so download views can return a StreamingHttpResponse instead of
+assembling the whole archive in memory first.
+"""
+
+import io
+import os
+import time
+import zipfile
+
+# Compression for archive members. JPEG2000 output is already entropy-coded,
+# so deflate gains next to nothing while costing many times the CPU; keep
+# members stored (if compression is ever offered, use ZIP_DEFLATED with
+# compresslevel=1)
+ZIP_COMPRESSION = zipfile.ZIP_STORED
+
+# Read size used when copying output files into the archive; 1 MiB matches
+# typical kernel readahead and keeps the number of WSGI writes low
+ZIP_CHUNK_SIZE = 1024 * 1024
+
+class _ChunkBuffer(io.RawIOBase):
+    """
+    Unseekable write target that collects the bytes zipfile writes.
+
+    zipfile detects that the target cannot seek and writes data
+    descriptors after each member instead of seeking back to patch the
+    local headers.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        """Return and clear everything written since the last drain."""
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def _zip_info_for(source, archive_name):
+    """
+    Build the ZipInfo for an open file, like ZipInfo.from_file but from fstat.
+
+    Args:
+        source (file): File object opened for reading
+        archive_name (str): Path of the member inside the archive
+
+    Returns:
+        zipfile.ZipInfo: Member metadata with size, timestamp and mode set
+    """
+    st = os.fstat(source.fileno())
+    zip_info = zipfile.ZipInfo(archive_name, time.localtime(st.st_mtime)[:6])
+    zip_info.external_attr = (st.st_mode & 0xFFFF) << 16
+    zip_info.file_size = st.st_size
+    zip_info.compress_type = ZIP_COMPRESSION
+    return zip_info
+
+def _open_prefetched(file_path):
+    """
+    Open a file for reading and ask the kernel to start reading it ahead.
+
+    Args:
+        file_path (str): Path of the file to open
+
+    Returns:
+        file: File object opened in binary mode
+    """
+    source = open(file_path, 'rb')
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(source.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+    return source
+
+def iter_zip(entries, chunk_size=ZIP_CHUNK_SIZE):
+    """
+    Generate a ZIP archive of files chunk by chunk.
+
+    Members are stored without compression (ZIP_COMPRESSION): JPEG2000
+    data is already wavelet-compressed, so deflating it again only costs CPU.
+    Memory use is bounded by chunk_size regardless of the archive size.
+    Each file is opened one member ahead with a readahead hint, so disk
+    reads of the next file overlap with sending the current one.
+
+    Args:
+        entries (iterable): (file_path, archive_name) pairs to add
+        chunk_size (int): Number of bytes read from each file at a time
+
+    Yields:
+        bytes: Consecutive chunks of the ZIP archive
+    """
+    entries = list(entries)
+    buffer = _ChunkBuffer()
+    upcoming = None
+    try:
+        with zipfile.ZipFile(buffer, 'w', compression=ZIP_COMPRESSION, allowZip64=True) as zip_file:
+            for index, (file_path, archive_name) in enumerate(entries):
+                source = upcoming if upcoming is not None else _open_prefetched(file_path)
+                upcoming = None
+                with source:
+                    # Open the next file now so the kernel reads it while this
+                    # one is being streamed
+                    if index + 1 < len(entries):
+                        upcoming = _open_prefetched(entries[index + 1][0])
+                    # Member metadata comes from the open descriptor, so each file
+                    # is looked up by path only once
+                    zip_info = _zip_info_for(source, archive_name)
+                    with zip_file.open(zip_info, 'w') as dest:
+                        # Local file header
+                        yield buffer.drain()
+                        while True:
+                            chunk = source.read(chunk_size)
+                            if not chunk:
+                                break
+                            dest.write(chunk)
+                            # Stored data is drained as the same bytes object, uncopied
+                            yield buffer.drain()
+                # Data descriptor
+                yield buffer.drain()
+        # Central directory, written when the archive is closed
+        yield buffer.drain()
+    finally:
+        if upcoming is not None:
+            upcoming.close()
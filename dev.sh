@@ -82,7 +82,7 @@ start_services() {
     trap 'echo -e "\n${YELLOW}Stopping background services...${NC}"; kill $(jobs -p) 2>/dev/null || true; exit 0' INT TERM EXIT
 
     # Start Celery worker in background
-    celery -A jp2forge_web worker -l INFO > logs/celery.log 2>&1 &
+    celery -A jp2forge_web worker -l INFO -Q celery,cleanup > logs/celery.log 2>&1 &
     CELERY_PID=$!
     echo -e "${GREEN}✓ Celery worker started in background (PID: $CELERY_PID, logs at logs/celery.log)${NC}"
 
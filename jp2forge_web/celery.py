@@ -1,6 +1,7 @@
 import os
 import socket
 from celery import Celery
+from celery.signals import worker_process_init
 
 # Set the default Django settings module
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jp2forge_web.settings')
@@ -19,3 +20,16 @@ app.conf.broker_connection_retry_on_startup = True
 
 # Auto-discover tasks in all installed apps
 app.autodiscover_tasks()
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """Prepare each worker process once, before it runs its first task."""
+    from django.db import connections
+    
+    # Import the task module so the ORM models, BnF validator and JP2Forge
+    # adapter singleton are loaded at startup instead of on the first job
+    import converter.tasks  # noqa: F401
+    
+    # Connections inherited from the parent process must not be shared
+    connections.close_all()
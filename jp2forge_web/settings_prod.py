@@ -89,6 +89,9 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD'),
         'HOST': os.environ.get('DB_HOST'),
         'PORT': os.environ.get('DB_PORT', '5432'),
+        # Reuse connections across requests/tasks and verify them before reuse
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -145,6 +148,14 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutes
+# Conversions are long-running; don't let one worker process reserve queued jobs
+# behind the one it is running while other processes sit idle
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+CELERY_TASK_ROUTES = {
+    # Keep filesystem cleanup off the conversion queue
+    'converter.tasks.cleanup_temp_dir': {'queue': 'cleanup'},
+    'converter.tasks.cleanup_job_dirs': {'queue': 'cleanup'},
+}
 
 # Login URLs
 LOGIN_URL = 'login'